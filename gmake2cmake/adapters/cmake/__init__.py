@@ -1,7 +1,28 @@
-"""CMake-related adapter exports."""
+"""CMake-related adapter exports.
+
+Names are resolved lazily (PEP 562) so importing the adapter package does
+not load the emitter and IR modules until ``emit`` or ``EmitOptions`` is used.
+"""
 
 from __future__ import annotations
 
-from gmake2cmake.cmake.emitter import EmitOptions, emit
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from gmake2cmake.cmake.emitter import EmitOptions, emit
 
 __all__ = ["EmitOptions", "emit"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in __all__:
+        from gmake2cmake.cmake import emitter
+
+        value = getattr(emitter, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(__all__)
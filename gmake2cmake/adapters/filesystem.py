@@ -1,19 +1,17 @@
-"""Filesystem adapter exports to keep IO at the boundary."""
+"""Filesystem adapter exports to keep IO at the boundary.
+
+Everything in ``gmake2cmake.fs.__all__`` is re-exported, and ``__all__`` is
+built from that list, so the two cannot drift apart. ``gmake2cmake.fs`` only
+depends on the standard library, so it is imported eagerly.
+"""
 
 from __future__ import annotations
 
-from gmake2cmake.fs import (
-    FileSystemAdapter,
-    LocalFS,
-    TestFileSystemAdapter,
-    atomic_write,
-    temporary_directory,
-)
+from gmake2cmake import fs as _fs
+from gmake2cmake.fs import *  # noqa: F403 - re-exports fs.__all__
+
+__all__ = list(_fs.__all__)
+
 
-__all__ = [
-    "FileSystemAdapter",
-    "LocalFS",
-    "TestFileSystemAdapter",
-    "atomic_write",
-    "temporary_directory",
-]
+def __dir__() -> list[str]:
+    return sorted(__all__)
@@ -6,15 +6,52 @@ different versions and optimization strategies.
 
 from __future__ import annotations
 
+import itertools
+import sys
 import time
+import timeit
 import tracemalloc
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, TypeVar
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    TextIO,
+    TypeVar,
+)
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    RESOURCE_AVAILABLE = False
 
 T = TypeVar("T")
 
+# Bound format methods parse their spec once at import rather than per call.
+_RESULT_FMT = "{:40s} | {:8.3f}s | {:8.3f}ms | {:8.1f}MB".format
+_COMPARISON_FMT = "{:<40} {}{:>6.1f}% ({:.2f}x)".format
+_TOTAL_FMT = "{:<40} {:<12.3f}s".format
+_SUMMARY_RULE = "=" * 90
+_SUMMARY_DIVIDER = "-" * 90
+_SUMMARY_HEADER = f"{'Benchmark':<40} {'Total (s)':<12} {'Avg (ms)':<12} {'Peak (MB)':<12}"
 
-@dataclass
+# ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere.
+_MAXRSS_TO_MB = 1 / (1024 * 1024) if sys.platform == "darwin" else 1 / 1024
+
+
+def _peak_rss() -> int:
+    """Return the process peak resident set size in ru_maxrss units."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+@dataclass(slots=True)
 class BenchmarkResult:
     """Result of a single benchmark measurement.
 
@@ -23,7 +60,8 @@ class BenchmarkResult:
         elapsed_seconds: Total elapsed time in seconds
         memory_peak_mb: Peak memory usage in megabytes
         iterations: Number of iterations performed
-        ops_per_sec: Operations per second (if applicable)
+        ops_per_sec: Operations per second; derived from iterations and
+            elapsed_seconds when not given
     """
 
     name: str
@@ -32,6 +70,10 @@ class BenchmarkResult:
     iterations: int = 1
     ops_per_sec: float = 0.0
 
+    def __post_init__(self) -> None:
+        if self.ops_per_sec == 0.0 and self.elapsed_seconds > 0:
+            self.ops_per_sec = self.iterations / self.elapsed_seconds
+
     @property
     def avg_time_ms(self) -> float:
         """Average time per iteration in milliseconds."""
@@ -41,15 +83,12 @@ class BenchmarkResult:
 
     def __str__(self) -> str:
         """Format benchmark result as string."""
-        return (
-            f"{self.name:40s} | "
-            f"{self.elapsed_seconds:8.3f}s | "
-            f"{self.avg_time_ms:8.3f}ms | "
-            f"{self.memory_peak_mb:8.1f}MB"
+        return _RESULT_FMT(
+            self.name, self.elapsed_seconds, self.avg_time_ms, self.memory_peak_mb
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkSuite:
     """Collection of benchmark results with statistics.
 
@@ -62,6 +101,10 @@ class BenchmarkSuite:
     name: str
     results: List[BenchmarkResult] = field(default_factory=list)
     baseline: Optional[BenchmarkSuite] = None
+    _by_name: Dict[str, BenchmarkResult] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _indexed_count: int = field(default=0, init=False, repr=False, compare=False)
 
     def add_result(self, result: BenchmarkResult) -> None:
         """Add a benchmark result to the suite.
@@ -79,6 +122,27 @@ class BenchmarkSuite:
         """
         return sum(r.elapsed_seconds for r in self.results)
 
+    def get_result(self, name: str) -> Optional[BenchmarkResult]:
+        """Look up the first result recorded under a name.
+
+        The name index is extended lazily from ``results``, so results
+        appended directly to the list are still found.
+
+        Args:
+            name: Name of the benchmark
+
+        Returns:
+            Matching BenchmarkResult or None
+        """
+        if self._indexed_count > len(self.results):
+            self._by_name.clear()
+            self._indexed_count = 0
+        if self._indexed_count < len(self.results):
+            for result in self.results[self._indexed_count:]:
+                self._by_name.setdefault(result.name, result)
+            self._indexed_count = len(self.results)
+        return self._by_name.get(name)
+
     def get_comparison_with_baseline(self, name: str) -> Dict[str, float]:
         """Compare a result with baseline.
 
@@ -91,8 +155,8 @@ class BenchmarkSuite:
         if not self.baseline:
             return {}
 
-        current = next((r for r in self.results if r.name == name), None)
-        baseline = next((r for r in self.baseline.results if r.name == name), None)
+        current = self.get_result(name)
+        baseline = self.baseline.get_result(name)
 
         if not current or not baseline:
             return {}
@@ -110,55 +174,83 @@ class BenchmarkSuite:
             "memory_improvement_percent": memory_improvement,
         }
 
-    def print_summary(self) -> str:
-        """Print summary of all benchmark results.
+    def iter_summary(self) -> Iterator[str]:
+        """Yield the summary one line at a time.
 
-        Returns:
-            Formatted string with results
+        Yields:
+            Formatted summary lines without trailing newlines
         """
-        lines = [
-            f"\nBenchmark Suite: {self.name}",
-            "=" * 90,
-            f"{'Benchmark':<40} {'Total (s)':<12} {'Avg (ms)':<12} {'Peak (MB)':<12}",
-            "-" * 90,
-        ]
+        yield f"\nBenchmark Suite: {self.name}"
+        yield _SUMMARY_RULE
+        yield _SUMMARY_HEADER
+        yield _SUMMARY_DIVIDER
 
         for result in self.results:
-            lines.append(str(result))
+            yield str(result)
 
-        lines.append("-" * 90)
-        lines.append(f"{'TOTAL':<40} {self.total_time():<12.3f}s")
+        yield _SUMMARY_DIVIDER
+        yield _TOTAL_FMT("TOTAL", self.total_time())
 
         if self.baseline:
-            lines.append("\n" + "Comparison with Baseline:")
-            lines.append("-" * 90)
+            yield "\n" + "Comparison with Baseline:"
+            yield _SUMMARY_DIVIDER
             for result in self.results:
                 comparison = self.get_comparison_with_baseline(result.name)
                 if comparison:
                     improvement = comparison.get("time_improvement_percent", 0)
                     sign = "+" if improvement > 0 else ""
-                    lines.append(
-                        f"{result.name:<40} {sign}{improvement:>6.1f}% "
-                        f"({comparison['time_ratio']:.2f}x)"
-                    )
+                    yield _COMPARISON_FMT(result.name, sign, improvement, comparison["time_ratio"])
+
+    def write_summary(self, file: TextIO) -> None:
+        """Stream the summary to a text file without building it in memory.
 
-        return "\n".join(lines)
+        Args:
+            file: Writable text stream (e.g. sys.stdout)
+        """
+        for line in self.iter_summary():
+            file.write(line + "\n")
+
+    def print_summary(self) -> str:
+        """Print summary of all benchmark results.
+
+        Returns:
+            Formatted string with results
+        """
+        return "\n".join(self.iter_summary())
 
 
 class Benchmark:
     """Context manager for benchmarking code blocks.
 
+    Memory tracking samples the process peak RSS on entry and exit, which
+    reports growth of the high-water mark without slowing the measured code.
+    Pass ``precise_memory=True`` to trace Python allocations with tracemalloc
+    instead; this is exact but can slow the workload several times over.
+
     Example:
         >>> with Benchmark("operation", track_memory=True) as bench:
         ...     expensive_operation()
         >>> print(bench.result)
     """
 
+    __slots__ = (
+        "name",
+        "track_memory",
+        "precise_memory",
+        "iterations",
+        "result",
+        "elapsed_ns",
+        "_start_ns",
+        "_start_memory",
+        "_peak_memory",
+    )
+
     def __init__(
         self,
         name: str,
         track_memory: bool = False,
         iterations: int = 1,
+        precise_memory: bool = False,
     ) -> None:
         """Initialize benchmark context.
 
@@ -166,36 +258,44 @@ class Benchmark:
             name: Name of the operation being benchmarked
             track_memory: If True, track peak memory usage
             iterations: Number of iterations (for averaging)
+            precise_memory: If True, measure memory with tracemalloc instead
+                of peak RSS (implies track_memory)
         """
         self.name = name
-        self.track_memory = track_memory
+        self.track_memory = track_memory or precise_memory
+        self.precise_memory = precise_memory or (self.track_memory and not RESOURCE_AVAILABLE)
         self.iterations = iterations
         self.result: Optional[BenchmarkResult] = None
-        self._start_time: float = 0.0
+        self._start_ns: int = 0
+        self.elapsed_ns: int = 0
         self._start_memory: int = 0
         self._peak_memory: int = 0
 
     def __enter__(self) -> Benchmark:
         """Enter benchmark context."""
-        self._start_time = time.perf_counter()
-        if self.track_memory:
+        if self.precise_memory:
             tracemalloc.start()
             self._start_memory, _ = tracemalloc.get_traced_memory()
+        elif self.track_memory:
+            self._start_memory = _peak_rss()
+        self._start_ns = time.perf_counter_ns()
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Exit benchmark context and record result."""
-        elapsed = time.perf_counter() - self._start_time
+        self.elapsed_ns = time.perf_counter_ns() - self._start_ns
 
         memory_peak_mb = 0.0
-        if self.track_memory:
+        if self.precise_memory:
             _, peak = tracemalloc.get_traced_memory()
             tracemalloc.stop()
             memory_peak_mb = (peak - self._start_memory) / (1024 * 1024)
+        elif self.track_memory:
+            memory_peak_mb = (_peak_rss() - self._start_memory) * _MAXRSS_TO_MB
 
         self.result = BenchmarkResult(
             name=self.name,
-            elapsed_seconds=elapsed,
+            elapsed_seconds=self.elapsed_ns / 1e9,
             memory_peak_mb=max(0.0, memory_peak_mb),
             iterations=self.iterations,
         )
@@ -207,6 +307,7 @@ def benchmark_function(
     name: Optional[str] = None,
     iterations: int = 1,
     track_memory: bool = False,
+    auto: bool = False,
     **kwargs: Any,
 ) -> tuple[T, BenchmarkResult]:
     """Benchmark a function call.
@@ -217,6 +318,8 @@ def benchmark_function(
         name: Name for the benchmark (defaults to function name)
         iterations: Number of iterations to run
         track_memory: If True, track peak memory usage
+        auto: If True, let ``timeit.Timer.autorange`` pick the iteration
+            count (ignores iterations and track_memory); use for sub-ms work
         **kwargs: Keyword arguments for function
 
     Returns:
@@ -224,32 +327,87 @@ def benchmark_function(
     """
     benchmark_name = name or func.__name__
 
+    if auto:
+        return _autorange_function(func, args, kwargs, benchmark_name)
+
+    # Same shape as timeit's inner loop: local bindings and a C-level
+    # iterator keep per-iteration interpreter overhead out of the timing.
+    repeat = itertools.repeat
+    local_func = func
+    result = None
     with Benchmark(benchmark_name, track_memory=track_memory, iterations=iterations) as bench:
-        result = None
-        for _ in range(iterations):
-            result = func(*args, **kwargs)
+        if kwargs:
+            for _ in repeat(None, iterations):
+                result = local_func(*args, **kwargs)
+        elif args:
+            for _ in repeat(None, iterations):
+                result = local_func(*args)
+        else:
+            for _ in repeat(None, iterations):
+                result = local_func()
 
     return result, bench.result  # type: ignore
 
 
+def _autorange_function(
+    func: Callable[..., T],
+    args: tuple[Any, ...],
+    kwargs: Dict[str, Any],
+    name: str,
+) -> tuple[T, BenchmarkResult]:
+    """Time func with timeit's autorange, keeping the last return value."""
+    last: List[Any] = [None]
+
+    def call() -> None:
+        last[0] = func(*args, **kwargs)
+
+    count, elapsed = timeit.Timer(call).autorange()
+    return last[0], BenchmarkResult(name=name, elapsed_seconds=elapsed, iterations=count)
+
+
 def profile_function(
     func: Callable[..., T],
     *args: Any,
+    mode: Literal["cprofile", "sampling"] = "cprofile",
+    file: Optional[TextIO] = None,
     **kwargs: Any,
 ) -> T:
-    """Profile a function and print results.
+    """Profile a function and write its report to ``file``.
+
+    The default ``cprofile`` mode instruments every call. It gives exact call
+    counts but adds noticeable overhead that skews cumulative timings. The
+    ``sampling`` mode uses pyinstrument (optional, ``pip install
+    gmake2cmake[profiling]``), which samples the stack with roughly 1%
+    overhead. Use it for pipeline-level parse/build/emit timing.
 
     Args:
         func: Function to profile
         *args: Positional arguments
+        mode: Profiler to use, "cprofile" or "sampling"
+        file: Writable text stream for the report; nothing is written if None
         **kwargs: Keyword arguments
 
     Returns:
         Function result
+
+    Raises:
+        ValueError: If mode is not recognised
+        ImportError: If sampling mode is requested without pyinstrument
     """
+    if mode == "sampling":
+        from pyinstrument import Profiler
+
+        sampler = Profiler()
+        with sampler:
+            result = func(*args, **kwargs)
+        if file is not None:
+            file.write(sampler.output_text(unicode=True, color=False))
+        return result
+    if mode != "cprofile":
+        raise ValueError(f"Unknown profiling mode: {mode}")
+
     import cProfile
     import pstats
-    from io import StringIO
 
     profiler = cProfile.Profile()
     profiler.enable()
@@ -258,34 +416,32 @@ def profile_function(
 
     profiler.disable()
 
-    # Print statistics
-    stats = pstats.Stats(profiler, stream=StringIO())
-    stats.sort_stats("cumulative")
-    stats.print_stats(10)  # Top 10 functions
+    if file is not None:
+        stats = pstats.Stats(profiler, stream=file)
+        stats.sort_stats("cumulative")
+        stats.print_stats(10)  # Top 10 functions
 
     return result
 
 
-# Performance targets
-PERFORMANCE_TARGETS = {
-    "parse_makefile": {
-        "time_ms": 10,
-        "description": "Parse single Makefile",
-    },
-    "evaluate_variables": {
-        "time_ms": 1,
-        "description": "Evaluate variable expansion",
-    },
-    "discover_makefiles": {
-        "time_ms": 100,
-        "description": "Discover Makefiles in project",
-    },
-    "build_project": {
-        "time_ms": 500,
-        "description": "Build complete IR",
-    },
-    "emit_cmake": {
-        "time_ms": 100,
-        "description": "Emit CMakeLists.txt",
-    },
-}
+@dataclass(frozen=True, slots=True)
+class PerformanceTarget:
+    """Time budget for a pipeline stage.
+
+    Attributes:
+        time_ms: Target wall time in milliseconds
+        description: Human-readable description of the stage
+    """
+
+    time_ms: float
+    description: str
+
+
+# Performance targets (read-only)
+PERFORMANCE_TARGETS: Mapping[str, PerformanceTarget] = MappingProxyType({
+    "parse_makefile": PerformanceTarget(10, "Parse single Makefile"),
+    "evaluate_variables": PerformanceTarget(1, "Evaluate variable expansion"),
+    "discover_makefiles": PerformanceTarget(100, "Discover Makefiles in project"),
+    "build_project": PerformanceTarget(500, "Build complete IR"),
+    "emit_cmake": PerformanceTarget(100, "Emit CMakeLists.txt"),
+})
@@ -2,13 +2,26 @@
 
 from __future__ import annotations
 
+import hashlib
+import logging
+import pickle
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple, Union
 
+from gmake2cmake.fs import atomic_write
 from gmake2cmake.make.evaluator import InferredCompile
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Sentinel distinguishing "not cached" from any cached value in one lookup.
+_MISSING: Any = object()
+
+_CacheKey = Union[Tuple[str, str], str]
+
+
+@dataclass(slots=True)
 class CacheStats:
     """Statistics about cache usage."""
 
@@ -23,7 +36,7 @@ class CacheStats:
         return self.hits / total if total > 0 else 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheConfig:
     """Configuration for evaluation cache."""
 
@@ -43,16 +56,22 @@ class EvaluationCache:
 
     Supports caching variable expansions and compile inferences with
     optional TTL limits. Thread-safe through Python's GIL.
+
+    ``functools.lru_cache`` is not used because compile inferences that
+    return None must stay uncached, both kinds of entry share a single
+    ``max_size`` budget, and callbacks are supplied per call. Hits are kept
+    to one ``dict.get`` plus a C-level ``move_to_end``.
     """
 
     def __init__(self, config: CacheConfig) -> None:
         """Initialize cache with given configuration."""
         self.config: CacheConfig = config
         self.stats: CacheStats = CacheStats()
-        self._variable_cache: Dict[str, str] = {}
-        self._compile_cache: Dict[str, InferredCompile] = {}
-        self._access_order: Dict[str, int] = {}
-        self._next_access_id: int = 0
+        # Variable and compile entries share one recency order so eviction
+        # across both kinds is a single popitem from the front. Variable
+        # entries are keyed by (name, env_hash) tuples and compile entries by
+        # the bare command hash, so the key types alone keep them apart.
+        self._entries: OrderedDict[_CacheKey, Any] = OrderedDict()
 
     def get_variable_expansion(
         self, variable_name: str, env_hash: str, callback: Callable[[str, str], str]
@@ -70,16 +89,17 @@ class EvaluationCache:
         if not self.config.enabled:
             return callback(variable_name, env_hash)
 
-        cache_key = f"var:{variable_name}:{env_hash}"
+        cache_key = (variable_name, env_hash)
 
-        if cache_key in self._variable_cache:
+        cached = self._entries.get(cache_key, _MISSING)
+        if cached is not _MISSING:
             self.stats.hits += 1
-            self._update_access(cache_key)
-            return self._variable_cache[cache_key]
+            self._entries.move_to_end(cache_key)
+            return cached
 
         self.stats.misses += 1
         result = callback(variable_name, env_hash)
-        self._insert_with_eviction(self._variable_cache, cache_key, result)
+        self._insert_with_eviction(cache_key, result)
         return result
 
     def get_compile_inference(
@@ -97,61 +117,33 @@ class EvaluationCache:
         if not self.config.enabled:
             return callback(cmd_hash)
 
-        cache_key = f"compile:{cmd_hash}"
-
-        if cache_key in self._compile_cache:
+        cached = self._entries.get(cmd_hash, _MISSING)
+        if cached is not _MISSING:
             self.stats.hits += 1
-            self._update_access(cache_key)
-            return self._compile_cache[cache_key]
+            self._entries.move_to_end(cmd_hash)
+            return cached
 
         self.stats.misses += 1
         result = callback(cmd_hash)
         if result is not None:
-            self._insert_with_eviction(self._compile_cache, cache_key, result)
+            self._insert_with_eviction(cmd_hash, result)
         return result
 
-    def _update_access(self, key: str) -> None:
-        """Update access time for LRU tracking."""
-        self._access_order[key] = self._next_access_id
-        self._next_access_id += 1
-
-    def _insert_with_eviction(self, cache: Dict[str, Any], key: str, value: Any) -> None:
-        """Insert into cache, evicting LRU item if at capacity."""
-        cache[key] = value
-        self._update_access(key)
-
-        # Check if we need to evict
-        total_size = len(self._variable_cache) + len(self._compile_cache)
-        if total_size > self.config.max_size:
-            # Find LRU key across all caches
-            lru_key = None
-            lru_access_id = self._next_access_id
-
-            for k in self._variable_cache:
-                if k in self._access_order and self._access_order[k] < lru_access_id:
-                    lru_key = k
-                    lru_access_id = self._access_order[k]
-
-            for k in self._compile_cache:
-                if k in self._access_order and self._access_order[k] < lru_access_id:
-                    lru_key = k
-                    lru_access_id = self._access_order[k]
-
-            # Evict LRU item
-            if lru_key:
-                if lru_key in self._variable_cache:
-                    del self._variable_cache[lru_key]
-                if lru_key in self._compile_cache:
-                    del self._compile_cache[lru_key]
-                del self._access_order[lru_key]
-                self.stats.evictions += 1
+    def _insert_with_eviction(self, key: _CacheKey, value: Any) -> None:
+        """Insert a missing key, evicting the LRU entry if over capacity.
+
+        Callers only insert after a miss, so the key is new and lands at the
+        most-recent end of the OrderedDict's linked list without a relink.
+        """
+        entries = self._entries
+        entries[key] = value
+        if len(entries) > self.config.max_size:
+            entries.popitem(last=False)
+            self.stats.evictions += 1
 
     def clear(self) -> None:
         """Clear all cached data."""
-        self._variable_cache.clear()
-        self._compile_cache.clear()
-        self._access_order.clear()
-        self._next_access_id = 0
+        self._entries.clear()
 
     def get_stats(self) -> CacheStats:
         """Get current cache statistics."""
@@ -162,6 +154,69 @@ class EvaluationCache:
         )
 
 
+def compute_content_key(*parts: str) -> str:
+    """Hash several strings into one cache key for ``PickleDirectoryCache``.
+
+    Args:
+        parts: Inputs the cached value depends on, e.g. path, content, config
+
+    Returns:
+        32-character blake2b hex digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        encoded = part.encode("utf-8")
+        # Length-prefix each part so ("ab", "c") and ("a", "bc") differ.
+        digest.update(len(encoded).to_bytes(8, "little"))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+class PickleDirectoryCache:
+    """Pickled values stored one file per key under a directory.
+
+    Unreadable or incompatible entries count as misses and values that cannot
+    be pickled are skipped, so the cache never fails a run. Files are
+    replaced atomically so concurrent runs never read a partial entry.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory: Path = Path(directory)
+        self.stats: CacheStats = CacheStats()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pkl"
+
+    def get(self, key: str) -> Any:
+        """Return the value stored under ``key``, or None on a miss."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as handle:
+                value = pickle.load(handle)
+        except FileNotFoundError:
+            self.stats.misses += 1
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as exc:
+            logger.debug("Ignoring unreadable cache entry %s: %s", path, exc)
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key``, replacing any previous entry."""
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as exc:
+            logger.debug("Not caching unpicklable value for %s: %s", key, exc)
+            return
+        try:
+            with atomic_write(self._path(key)) as tmp:
+                tmp.write_bytes(payload)
+        except OSError as exc:
+            logger.debug("Could not write cache entry %s: %s", key, exc)
+
+
 def make_cache_disabled() -> EvaluationCache:
     """Create a disabled cache for when caching is not needed."""
     config = CacheConfig(enabled=False)
@@ -1,38 +1,53 @@
 from __future__ import annotations
 
 import argparse
-import json
 import logging
+import os
 import sys
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache, partial
+from importlib.util import find_spec
+from itertools import repeat
+from operator import attrgetter
 from pathlib import Path
-from typing import Callable, Optional, TextIO
+from shutil import which
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, TextIO
 
-from gmake2cmake import config as config_module
-from gmake2cmake import introspection, introspection_parser, introspection_reconcile
-from gmake2cmake.cmake import emitter as cmake_emitter
 from gmake2cmake.constants import (
+    ANALYSIS_CACHE_SUBDIR,
     DEFAULT_OUTPUT_DIR,
     DEFAULT_PROJECT_NAME,
     DEFAULT_SOURCE_DIR,
     REPORT_JSON_FILENAME,
     REPORT_MD_FILENAME,
 )
-from gmake2cmake.diagnostics import DiagnosticCollector, add, exit_code, to_console
-from gmake2cmake.fs import FileSystemAdapter, LocalFS
-from gmake2cmake.ir import builder as ir_builder
+from gmake2cmake.diagnostics import Diagnostic, DiagnosticCollector, add, exit_code, to_console
+from gmake2cmake.fs import FileSystemAdapter, LocalFS, open_write
 from gmake2cmake.ir.unknowns import UnknownConstruct, UnknownConstructFactory
 from gmake2cmake.ir.unknowns import to_dict as unknown_to_dict
 from gmake2cmake.logging_config import log_timed_block, setup_logging
-from gmake2cmake.make import discovery, evaluator
-from gmake2cmake.make import parser as make_parser
-from gmake2cmake.markdown_reporter import MarkdownReporter
-from gmake2cmake.profiling import disable_profiling, enable_profiling, get_metrics
-from gmake2cmake.validation import validate_cli_args
 
+if TYPE_CHECKING:
+    from gmake2cmake.config import ConfigModel
 
-@dataclass
+# Checked without importing; orjson itself is loaded when a report is written.
+ORJSON_AVAILABLE = find_spec("orjson") is not None
+
+# Pipeline stages (parser, evaluator, IR builder, emitter, introspection,
+# reporting, profiling) are imported inside the functions that use them so
+# --help, argument errors and --validate-config do not pay for loading them.
+# Config loading (and YAML), CLI validation, json and pickle are deferred the
+# same way, since --help and argument errors exit before using them.
+
+_PIPELINE_LOGGER = logging.getLogger("gmake2cmake.pipeline")
+_PROFILE_LOGGER = logging.getLogger("gmake2cmake.profile")
+
+_DIAGNOSTIC_KEYS = ("severity", "code", "message", "location", "origin", "line")
+_DIAGNOSTIC_FIELDS = attrgetter(*_DIAGNOSTIC_KEYS)
+
+
+@dataclass(slots=True)
 class CLIArgs:
     """Parsed command-line arguments for gmake2cmake.
 
@@ -54,6 +69,8 @@ class CLIArgs:
         log_rotate_interval: Interval multiplier for timed rotation
         syslog_address: Optional syslog destination (path or host:port)
         validate_config: If True, validate config and exit without conversion
+        use_make_introspection: If True, reconcile against 'make -pn' output
+        cache: If True, reuse and store per-file analyses in the on-disk cache
     """
 
     source_dir: Path
@@ -75,9 +92,10 @@ class CLIArgs:
     profile: bool = False
     validate_config: bool = False
     use_make_introspection: bool = False
+    cache: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class RunContext:
     """Execution context passed through the pipeline.
 
@@ -86,14 +104,14 @@ class RunContext:
     config: Configuration model loaded from YAML
     diagnostics: Collector for diagnostic messages and errors
     filesystem: File system adapter (for testing/modularity)
-    now: Callable that returns current datetime
+    now: Callable that returns the current (UTC) datetime
     unknown_constructs: List of constructs that could not be handled
     unknown_factory: Factory for creating UnknownConstruct instances
     correlation_id: Correlation ID used for tracing logs
     """
 
     args: CLIArgs
-    config: config_module.ConfigModel
+    config: ConfigModel
     diagnostics: DiagnosticCollector
     filesystem: FileSystemAdapter
     now: Callable[[], datetime]
@@ -126,20 +144,18 @@ class IntrospectionSummary:
         }
 
 
-def parse_args(argv: list[str]) -> CLIArgs:
-    """Parse and return command-line arguments.
-
-    Provides comprehensive help text and examples for gmake2cmake usage.
+def _abspath(raw: str, cwd: str) -> Path:
+    """Make a user-supplied path absolute without touching the filesystem.
 
-    Args:
-        argv: Command-line arguments to parse (typically sys.argv[1:])
+    Unlike ``Path.resolve`` this does not ``lstat`` each component, so
+    symlinks are left as given; downstream code only needs absolute paths.
+    """
+    return Path(os.path.normpath(os.path.join(cwd, os.path.expanduser(raw))))
 
-    Returns:
-        CLIArgs instance with parsed arguments
 
-    Raises:
-        ValueError: If required arguments are invalid
-    """
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    # Built once per process; ArgumentParser.parse_args does not mutate it.
     parser = argparse.ArgumentParser(
         prog="gmake2cmake",
         add_help=True,
@@ -257,31 +273,55 @@ Examples:
         action="store_true",
         help="Opt-in to GNU make introspection (runs 'make -pn' in source_dir)",
     )
-    parsed = parser.parse_args(argv)
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse analyzed Makefiles from the per-user cache and store new ones",
+    )
+    return parser
+
+
+def parse_args(argv: list[str]) -> CLIArgs:
+    """Parse and return command-line arguments.
+
+    Provides comprehensive help text and examples for gmake2cmake usage.
+
+    Args:
+        argv: Command-line arguments to parse (typically sys.argv[1:])
+
+    Returns:
+        CLIArgs instance with parsed arguments
+
+    Raises:
+        ValueError: If required arguments are invalid
+    """
+    parsed = _build_parser().parse_args(argv)
     if not str(parsed.source_dir):
         raise ValueError("source_dir cannot be empty")
     if not str(parsed.output_dir):
         raise ValueError("output_dir cannot be empty")
+    cwd = os.getcwd()
     return CLIArgs(
-        source_dir=Path(parsed.source_dir).expanduser().resolve(),
+        source_dir=_abspath(parsed.source_dir, cwd),
         entry_makefile=parsed.entry_makefile,
-        output_dir=Path(parsed.output_dir).expanduser().resolve(),
-        config_path=Path(parsed.config_path).expanduser().resolve() if parsed.config_path else None,
-        dry_run=bool(parsed.dry_run),
-        report=bool(parsed.report),
-        verbose=int(parsed.verbose),
-        strict=bool(parsed.strict),
+        output_dir=_abspath(parsed.output_dir, cwd),
+        config_path=_abspath(parsed.config_path, cwd) if parsed.config_path else None,
+        dry_run=parsed.dry_run,
+        report=parsed.report,
+        verbose=parsed.verbose,
+        strict=parsed.strict,
         processes=parsed.processes,
-        with_packaging=bool(parsed.with_packaging),
-        log_file=Path(parsed.log_file).expanduser().resolve() if parsed.log_file else None,
-        log_max_bytes=int(parsed.log_max_bytes),
-        log_backup_count=int(parsed.log_backup_count),
+        with_packaging=parsed.with_packaging,
+        log_file=_abspath(parsed.log_file, cwd) if parsed.log_file else None,
+        log_max_bytes=parsed.log_max_bytes,
+        log_backup_count=parsed.log_backup_count,
         log_rotate_when=parsed.log_rotate_when,
-        log_rotate_interval=int(parsed.log_rotate_interval),
+        log_rotate_interval=parsed.log_rotate_interval,
         syslog_address=parsed.syslog_address,
-        profile=bool(parsed.profile),
-        validate_config=bool(parsed.validate_config),
-        use_make_introspection=bool(parsed.use_make_introspection),
+        profile=parsed.profile,
+        validate_config=parsed.validate_config,
+        use_make_introspection=parsed.use_make_introspection,
+        cache=parsed.cache,
     )
 
 
@@ -303,6 +343,11 @@ def handle_exception(exc: Exception, diagnostics: DiagnosticCollector) -> None:
     add(diagnostics, "ERROR", "CLI_UNHANDLED", f"Unhandled exception: {exc}")
 
 
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@lru_cache(maxsize=8)
 def _normalize_syslog_address(raw: Optional[str]) -> Optional[str | tuple[str, int]]:
     if not raw:
         return None
@@ -317,8 +362,9 @@ def _normalize_syslog_address(raw: Optional[str]) -> Optional[str | tuple[str, i
     return raw
 
 
+@lru_cache(maxsize=1)
 def _make_in_path() -> bool:
-    from shutil import which
+    # PATH is not expected to change during a process, so one lookup is enough.
     return which("make") is not None
 
 
@@ -335,14 +381,17 @@ def run(
         return exit_code(early_diag)
     diagnostics = DiagnosticCollector()
     fs = fs or LocalFS()
-    now = now or datetime.utcnow
+    now = now or _utcnow
     syslog_address = _normalize_syslog_address(args.syslog_address)
+    from gmake2cmake.validation import validate_cli_args
+
     validate_cli_args(args, diagnostics)
     if args.use_make_introspection and not _make_in_path():
         add(diagnostics, "ERROR", "CLI_UNHANDLED", "GNU make not found in PATH; introspection requires 'make'")
-    if exit_code(diagnostics) != 0:
+    code = exit_code(diagnostics)
+    if code != 0:
         to_console(diagnostics, stream=_stdout(), verbose=True)
-        return exit_code(diagnostics)
+        return code
     correlation_id = setup_logging(
         verbosity=args.verbose,
         log_file=args.log_file,
@@ -353,8 +402,12 @@ def run(
         syslog_address=syslog_address,
     )
     if args.profile:
+        from gmake2cmake.profiling import enable_profiling
+
         enable_profiling()
-    config = config_module.load_and_merge(args, diagnostics, fs)
+    from gmake2cmake.config import load_and_merge
+
+    config = load_and_merge(args, diagnostics, fs)
     ctx = RunContext(
         args=args,
         config=config,
@@ -368,11 +421,9 @@ def run(
         return _handle_validate_config(ctx)
 
     _execute_pipeline(ctx, diagnostics, pipeline_fn)
-    if args.profile:
-        _emit_profile_summary()
     summary = _make_introspection_summary(ctx)
     if args.verbose and summary.enabled:
-        logging.getLogger("gmake2cmake.pipeline").info(
+        _PIPELINE_LOGGER.info(
             "introspection summary",
             extra={"event": "introspection_summary", **summary.to_dict()},
         )
@@ -401,9 +452,10 @@ def _parse_cli_args(argv: list[str]) -> CLIArgs:
 
 def _handle_validate_config(ctx: RunContext) -> int:
     to_console(ctx.diagnostics, stream=_stdout(), verbose=bool(ctx.args.verbose))
-    if exit_code(ctx.diagnostics) == 0:
+    code = exit_code(ctx.diagnostics)
+    if code == 0:
         _stdout().write("Configuration is valid.\n")
-    return exit_code(ctx.diagnostics)
+    return code
 
 
 def _execute_pipeline(ctx: RunContext, diagnostics: DiagnosticCollector, pipeline_fn: Optional[Callable[[RunContext], None]]) -> None:
@@ -423,15 +475,22 @@ def _execute_pipeline(ctx: RunContext, diagnostics: DiagnosticCollector, pipelin
 
 
 def _emit_profile_summary() -> None:
+    from gmake2cmake.profiling import disable_profiling, get_metrics, is_profiling_enabled
+
+    # Emit once per enable_profiling(); repeat calls find profiling disabled.
+    if not is_profiling_enabled():
+        return
     disable_profiling()
     metrics = get_metrics()
     if metrics.stage_timings:
-        to_console(DiagnosticCollector(), stream=_stdout(), verbose=False)  # Empty line
-        logger = logging.getLogger("gmake2cmake.profile")
-        logger.info(metrics.get_summary())
+        _stdout().write("\n")
+        _PROFILE_LOGGER.info(metrics.get_summary())
 
 
 def _default_pipeline(ctx: RunContext) -> None:
+    from gmake2cmake import introspection
+    from gmake2cmake.make import discovery
+
     if ctx.args.use_make_introspection:
         with log_timed_block("introspection", verbosity=ctx.args.verbose):
             result = introspection.run(ctx.args.source_dir, ctx.diagnostics)
@@ -442,8 +501,15 @@ def _default_pipeline(ctx: RunContext) -> None:
         )
     if exit_code(ctx.diagnostics) != 0:
         return
-    for content in contents:
-        _process_file(content, ctx)
+    workers = ctx.args.processes or os.cpu_count() or 1
+    use_cache = ctx.args.cache
+    if not use_cache and (workers <= 1 or len(contents) <= 1):
+        for content in contents:
+            _process_file(content, ctx)
+        return
+    analyses = _collect_analyses(contents, ctx, workers, use_cache)
+    for content, analysis in zip(contents, analyses):
+        _merge_analysis(content, analysis, ctx)
 
 
 def _process_file(content, ctx: RunContext) -> None:
@@ -458,6 +524,8 @@ def _process_file(content, ctx: RunContext) -> None:
 
 
 def _parse_file(content, ctx: RunContext) -> None:
+    from gmake2cmake.make import parser as make_parser
+
     with log_timed_block(f"parse:{content.path}", verbosity=ctx.args.verbose):
         parse_result = make_parser.parse_makefile(
             content.content, content.path, unknown_factory=ctx.unknown_factory
@@ -470,6 +538,8 @@ def _parse_file(content, ctx: RunContext) -> None:
 
 
 def _evaluate_file(content, ctx: RunContext):
+    from gmake2cmake.make import evaluator
+
     with log_timed_block(f"evaluate:{content.path}", verbosity=ctx.args.verbose):
         return evaluator.evaluate_ast(
             content.parse_result.ast,
@@ -481,8 +551,16 @@ def _evaluate_file(content, ctx: RunContext):
 
 
 def _build_ir(facts, ctx: RunContext):
+    from gmake2cmake.ir import builder as ir_builder
+
     with log_timed_block("build", verbosity=ctx.args.verbose):
         result = ir_builder.build_project(facts, ctx.config, ctx.diagnostics)
+    return _reconcile_ir(result, ctx)
+
+
+def _reconcile_ir(result, ctx: RunContext):
+    from gmake2cmake import introspection_parser, introspection_reconcile
+
     if ctx.introspection_dump:
         data = introspection_parser.parse_dump(ctx.introspection_dump)
         result.project = introspection_reconcile.reconcile(result.project, data, ctx.diagnostics)
@@ -492,7 +570,218 @@ def _build_ir(facts, ctx: RunContext):
     return result
 
 
+@dataclass
+class _FileAnalysis:
+    """Parse, evaluate and build output for one Makefile, computed in a worker.
+
+    Unknown constructs carry worker-local ids until merged into the run.
+    """
+
+    parse_result: Any
+    unknowns: list[UnknownConstruct]
+    parsed_unknowns: int
+    diagnostics: list[Diagnostic] = field(default_factory=list)
+    ir_result: Any = None
+
+
+class _RecordingUnknownFactory(UnknownConstructFactory):
+    """Factory that remembers every construct it creates, in creation order."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.created: list[UnknownConstruct] = []
+
+    def create(self, **kwargs: Any) -> UnknownConstruct:
+        uc = super().create(**kwargs)
+        self.created.append(uc)
+        return uc
+
+
+def _analyze_file(path: str, text: str, config: ConfigModel, verbose: int) -> _FileAnalysis:
+    """Run parse, evaluate and build for one Makefile without touching the run context."""
+    from gmake2cmake.ir import builder as ir_builder
+    from gmake2cmake.make import evaluator
+    from gmake2cmake.make import parser as make_parser
+
+    factory = _RecordingUnknownFactory()
+    with log_timed_block(f"parse:{path}", verbosity=verbose):
+        parse_result = make_parser.parse_makefile(text, path, unknown_factory=factory)
+    analysis = _FileAnalysis(parse_result, factory.created, len(factory.created))
+    if any(diag["severity"] == "ERROR" for diag in parse_result.diagnostics):
+        return analysis
+    diagnostics = DiagnosticCollector()
+    with log_timed_block(f"evaluate:{path}", verbosity=verbose):
+        facts = evaluator.evaluate_ast(
+            parse_result.ast, evaluator.VariableEnv(), config, diagnostics, unknown_factory=factory
+        )
+    with log_timed_block("build", verbosity=verbose):
+        analysis.ir_result = ir_builder.build_project(facts, config, diagnostics)
+    analysis.diagnostics = diagnostics.diagnostics
+    return analysis
+
+
+def _collect_analyses(
+    contents, ctx: RunContext, workers: int, use_cache: bool
+) -> list[_FileAnalysis]:
+    """Load cached analyses and compute the rest, in a process pool when worthwhile.
+
+    Entries are keyed by the Makefile path and content, the config and a
+    fingerprint of the package sources. They are stored before merging, while
+    constructs still carry worker-local ids; dry runs only read the cache.
+    """
+    from gmake2cmake.cache import PickleDirectoryCache, compute_content_key
+
+    analyses: list[Optional[_FileAnalysis]] = [None] * len(contents)
+    keys: list[str] = []
+    cache = PickleDirectoryCache(_analysis_cache_dir()) if use_cache else None
+    if cache is not None:
+        version = _analysis_cache_version()
+        config_repr = repr(ctx.config)
+        for index, content in enumerate(contents):
+            key = compute_content_key(version, content.path, content.content, config_repr)
+            keys.append(key)
+            cached = cache.get(key)
+            if isinstance(cached, _FileAnalysis):
+                analyses[index] = cached
+    pending = [index for index, analysis in enumerate(analyses) if analysis is None]
+    computed = None
+    if workers > 1 and len(pending) > 1:
+        computed = _analyze_in_pool([contents[i] for i in pending], ctx, min(workers, len(pending)))
+    if computed is None:
+        computed = [
+            _analyze_file(contents[i].path, contents[i].content, ctx.config, ctx.args.verbose)
+            for i in pending
+        ]
+    for index, analysis in zip(pending, computed):
+        if cache is not None and not ctx.args.dry_run:
+            cache.put(keys[index], analysis)
+        analyses[index] = analysis
+    return analyses
+
+
+def _analysis_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / ANALYSIS_CACHE_SUBDIR
+
+
+@lru_cache(maxsize=1)
+def _analysis_cache_version() -> str:
+    """Fingerprint the package sources so any code change invalidates cached analyses.
+
+    The release version alone is not enough: editable installs keep the same
+    version while the parser, evaluator and builder change underneath.
+    """
+    import hashlib
+
+    package_dir = Path(__file__).resolve().parent
+    digest = hashlib.blake2b(digest_size=16)
+    for source in sorted(package_dir.rglob("*.py")):
+        digest.update(source.relative_to(package_dir).as_posix().encode("utf-8"))
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def _analyze_in_pool(contents, ctx: RunContext, workers: int) -> Optional[list[_FileAnalysis]]:
+    """Analyze Makefiles in worker processes, or return None to run serially."""
+    import pickle
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
+    paths = [content.path for content in contents]
+    texts = [content.content for content in contents]
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(
+                    _analyze_file, paths, texts, repeat(ctx.config), repeat(ctx.args.verbose)
+                )
+            )
+    except (OSError, BrokenProcessPool, pickle.PicklingError) as exc:
+        # Only pool start-up, worker death and pickling failures fall back;
+        # exceptions raised by the stages themselves propagate.
+        _PIPELINE_LOGGER.warning(
+            "Parallel analysis failed, falling back to serial: %s", exc
+        )
+        return None
+
+
+def _merge_analysis(content, analysis: _FileAnalysis, ctx: RunContext) -> None:
+    """Fold a worker's results into the run exactly as ``_process_file`` would.
+
+    Constructs are renumbered from the run's factory in creation order, and
+    only for the stages the serial pipeline would have reached, so ids and
+    messages match a serial run.
+    """
+    parse_result = analysis.parse_result
+    renamed = _adopt_unknowns(analysis.unknowns[: analysis.parsed_unknowns], ctx)
+    for diag in parse_result.diagnostics:
+        message, unknown_id = _renumber_message(diag["message"], diag.get("unknown_id"), renamed)
+        add(
+            ctx.diagnostics,
+            diag["severity"],
+            diag["code"],
+            message,
+            diag.get("location"),
+            unknown_id=unknown_id,
+        )
+    if parse_result.unknown_constructs:
+        ctx.unknown_constructs.extend(parse_result.unknown_constructs)
+    content.parse_result = parse_result
+    if exit_code(ctx.diagnostics) != 0 or analysis.ir_result is None:
+        return
+    renamed.update(_adopt_unknowns(analysis.unknowns[analysis.parsed_unknowns :], ctx))
+    for diag in analysis.diagnostics:
+        message, unknown_id = _renumber_message(diag.message, diag.unknown_id, renamed)
+        add(
+            ctx.diagnostics,
+            diag.severity,
+            diag.code,
+            message,
+            diag.location,
+            diag.origin,
+            diag.line,
+            unknown_id=unknown_id,
+        )
+    ir_result = _reconcile_ir(analysis.ir_result, ctx)
+    if exit_code(ctx.diagnostics) != 0 or ir_result.project is None:
+        return
+    _emit_targets(content.path, ir_result, ctx)
+
+
+def _adopt_unknowns(unknowns: list[UnknownConstruct], ctx: RunContext) -> dict[str, str]:
+    return {ctx.unknown_factory.reassign_id(uc): uc.id for uc in unknowns}
+
+
+def _renumber_message(
+    message: str, unknown_id: Optional[str], renamed: dict[str, str]
+) -> tuple[str, Optional[str]]:
+    """Swap a worker-local construct id for its run id.
+
+    Only the id the diagnostic declares in ``unknown_id`` is replaced, at the
+    start of the message where the producers put it; the rest of the text
+    is never scanned. An id that was not adopted, or a message that does not
+    lead with it, is an internal inconsistency: it is logged and the text is
+    left as is rather than failing the run.
+    """
+    if unknown_id is None:
+        return message, None
+    run_id = renamed.get(unknown_id)
+    if run_id is None:
+        _PIPELINE_LOGGER.warning(
+            "Diagnostic names unknown construct %s, which was not adopted", unknown_id
+        )
+        return message, unknown_id
+    if not message.startswith(unknown_id):
+        _PIPELINE_LOGGER.warning(
+            "Diagnostic for %s does not start with its id: %r", unknown_id, message
+        )
+        return message, run_id
+    return run_id + message[len(unknown_id) :], run_id
+
+
 def _emit_targets(path: str, ir_result, ctx: RunContext) -> None:
+    from gmake2cmake.cmake import emitter as cmake_emitter
+
     if ir_result.project.unknown_constructs:
         ctx.unknown_constructs.extend(ir_result.project.unknown_constructs)
     with log_timed_block(f"emit:{path}", verbosity=ctx.args.verbose):
@@ -500,6 +789,7 @@ def _emit_targets(path: str, ir_result, ctx: RunContext) -> None:
             dry_run=ctx.args.dry_run,
             packaging=ctx.config.packaging_enabled,
             namespace=ctx.config.namespace or (ctx.config.project_name or DEFAULT_PROJECT_NAME),
+            retain_files=False,
         )
         emit_result = cmake_emitter.emit(
             ir_result.project,
@@ -560,22 +850,27 @@ def _compute_introspection_summary(
 
 def _serialize_diagnostics(diagnostics: DiagnosticCollector) -> list[dict]:
     """Serialize diagnostics to JSON-compatible format."""
-    def _normalize_location(loc: Optional[str]) -> str:
-        if not loc:
-            return ""
-        return str(loc)
-
-    return [
-        {
-            "severity": d.severity,
-            "code": d.code,
-            "message": d.message,
-            "location": _normalize_location(d.location),
-            "origin": d.origin or "",
-            "line": d.line or "",
-        }
-        for d in diagnostics.diagnostics
-    ]
+    return list(_iter_serialized_diagnostics(diagnostics))
+
+
+def _iter_serialized_diagnostics(diagnostics: DiagnosticCollector) -> Iterator[dict]:
+    keys = _DIAGNOSTIC_KEYS
+    for severity, code, message, location, origin, line in map(
+        _DIAGNOSTIC_FIELDS, diagnostics.diagnostics
+    ):
+        yield dict(
+            zip(
+                keys,
+                (
+                    severity,
+                    code,
+                    message,
+                    str(location) if location else "",
+                    origin or "",
+                    line or "",
+                ),
+            )
+        )
 
 
 def _make_introspection_summary(ctx: RunContext) -> IntrospectionSummary:
@@ -609,29 +904,70 @@ def _write_report(
     project_name: str,
     introspection_summary: Optional[IntrospectionSummary] = None,
 ) -> None:
+    from gmake2cmake.markdown_reporter import MarkdownReporter
+
     report_path = output_dir / REPORT_JSON_FILENAME
     markdown_path = output_dir / REPORT_MD_FILENAME
-    diag_payload = _serialize_diagnostics(diagnostics)
-    unknown_payload = [unknown_to_dict(u) for u in unknowns]
     summary = introspection_summary or IntrospectionSummary(enabled=False)
     introspection_payload = summary.to_dict()
-    json_report = {
-        "diagnostics": diag_payload,
-        "unknown_constructs": unknown_payload,
-        "introspection": introspection_payload,
-    }
     reporter = MarkdownReporter(project_name)
     markdown = reporter.generate_report(diagnostics, unknowns, introspection_summary=introspection_payload)
     try:
         fs.makedirs(report_path.parent)
-        fs.write_text(report_path, json.dumps(json_report, sort_keys=True))
+        # Stream the JSON straight to the file rather than building the string.
+        with open_write(fs, report_path) as handle:
+            handle.writelines(_iter_report_json(diagnostics, unknowns, introspection_payload))
         fs.write_text(markdown_path, markdown)
     except (IOError, OSError) as exc:  # pragma: no cover - IO error path
         add(diagnostics, "ERROR", "REPORT_WRITE_FAIL", f"Failed to write report: {exc}")
-    except (TypeError, ValueError) as exc:  # pragma: no cover - serialization error path
+    except (TypeError, ValueError) as exc:
+        # The writer discards its temp file, so any previous report.json stays intact.
         add(diagnostics, "ERROR", "REPORT_SERIALIZE_FAIL", f"Failed to serialize report: {exc}")
 
 
+def _iter_report_json(
+    diagnostics: DiagnosticCollector, unknowns: list[UnknownConstruct], introspection: dict
+) -> Iterator[bytes]:
+    """Yield report.json as UTF-8 chunks, one diagnostic or unknown construct at a time.
+
+    Keys are sorted and separators compact, as ``json.dumps(report,
+    sort_keys=True, separators=(",", ":"), ensure_ascii=False)`` would
+    produce, without holding every serialized entry in memory at once.
+    """
+    encode = _json_encoder()
+    yield b'{"diagnostics":['
+    for index, entry in enumerate(_iter_serialized_diagnostics(diagnostics)):
+        yield encode(entry) if index == 0 else b"," + encode(entry)
+    yield b'],"introspection":'
+    yield encode(introspection)
+    yield b',"unknown_constructs":['
+    for index, uc in enumerate(unknowns):
+        yield encode(unknown_to_dict(uc)) if index == 0 else b"," + encode(unknown_to_dict(uc))
+    yield b"]}"
+
+
+def _json_encoder() -> Callable[[Any], bytes]:
+    """Return a compact, key-sorted JSON encoder; uses orjson when it is installed.
+
+    Both encoders write non-ASCII characters as UTF-8 rather than ``\\u``
+    escapes.
+    """
+    if ORJSON_AVAILABLE:
+        import orjson
+
+        return partial(orjson.dumps, option=orjson.OPT_SORT_KEYS)
+    return _report_encoder()
+
+
+@lru_cache(maxsize=1)
+def _report_encoder() -> Callable[[Any], bytes]:
+    import json
+
+    # Skipping the ASCII escape pass is cheaper, and the output is UTF-8 anyway.
+    encoder = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return lambda obj: encoder.encode(obj).encode("utf-8")
+
+
 def _stdout() -> TextIO:
     """Return the standard output stream.
 
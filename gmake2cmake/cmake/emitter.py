@@ -1,17 +1,68 @@
 from __future__ import annotations
 
+import io
+import os
+import posixpath
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from itertools import chain, islice
+from operator import attrgetter, lt
+from pathlib import Path, PurePath, PurePosixPath
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from gmake2cmake.diagnostics import DiagnosticCollector, add
-from gmake2cmake.fs import FileSystemAdapter
+from gmake2cmake.fs import FileSystemAdapter, LocalFS
 from gmake2cmake.ir.builder import Project, Target
 from gmake2cmake.ir.unknowns import UnknownConstruct, UnknownConstructFactory
 
 GLOBAL_MODULE_NAME = "ProjectGlobalConfig.cmake"
 PACKAGING_RULES_FILE = "Packaging.cmake"
 
+# include() lines built once at import rather than on every render.
+_GLOBAL_MODULE_INCLUDE = f'include("${{CMAKE_CURRENT_LIST_DIR}}/{GLOBAL_MODULE_NAME}")'
+_PACKAGING_RULES_INCLUDE = f'include("${{CMAKE_CURRENT_LIST_DIR}}/{PACKAGING_RULES_FILE}")'
+
+_CURRENT_DIR = PurePosixPath(".")
+
+# CMake command and library kind for each binary target type.
+_BINARY_TARGET_COMMANDS: Dict[str, Tuple[str, str]] = {
+    "executable": ("add_executable", ""),
+    "shared": ("add_library", " SHARED"),
+    "static": ("add_library", " STATIC"),
+    "object": ("add_library", " OBJECT"),
+}
+# Usage-requirement scope for target types that do not default to PUBLIC.
+_DEFAULT_SCOPES: Dict[str, str] = {
+    "interface": "INTERFACE",
+    "imported": "INTERFACE",
+    "executable": "PRIVATE",
+}
+_LIBRARY_TYPES = frozenset({"shared", "static", "object"})
+_INSTALLABLE_TYPES = frozenset({"shared", "static", "executable", "interface", "object"})
+_FLAG_INIT_LANGUAGES: Dict[str, str] = {"c": "C", "cpp": "CXX"}
+
+# Upper bound on threads writing generated files to the local filesystem.
+_WRITE_WORKERS = 8
+# Files rendered ahead of writing when generated contents are not retained.
+_WRITE_BATCH = 64
+
+_target_name = attrgetter("name")
+
+# Static body of the generated ConfigVersion file, built once at import.
+_VERSION_COMPAT_LINES: Tuple[str, ...] = (
+    "if(PACKAGE_FIND_VERSION)",
+    "  if(PACKAGE_VERSION VERSION_LESS PACKAGE_FIND_VERSION)",
+    "    set(PACKAGE_VERSION_COMPATIBLE FALSE)",
+    "  else()",
+    "    set(PACKAGE_VERSION_COMPATIBLE TRUE)",
+    "    if(PACKAGE_FIND_VERSION STREQUAL PACKAGE_VERSION)",
+    "      set(PACKAGE_VERSION_EXACT TRUE)",
+    "    endif()",
+    "  endif()",
+    "endif()",
+)
+
 
 @dataclass
 class GeneratedFile:
@@ -36,36 +87,62 @@ class EmitOptions:
     dry_run: bool
     packaging: bool
     namespace: str
+    # When False (and not a dry run), files are written in batches as they
+    # are rendered and EmitResult.generated_files is left empty.
+    retain_files: bool = True
 
 
 def _usage_scope(target: Target) -> str:
     # Use target's explicit visibility if set, otherwise default based on type
-    if target.visibility:
-        return target.visibility
-    if target.type in {"interface", "imported"}:
-        return "INTERFACE"
-    if target.type == "executable":
-        return "PRIVATE"
-    return "PUBLIC"
+    return target.visibility or _DEFAULT_SCOPES.get(target.type, "PUBLIC")
 
 
+# Sibling targets repeat the same include dirs and custom-command paths.
+@lru_cache(maxsize=4096)
 def _relativize(path: str, base: Path) -> str:
-    candidate = Path(path)
-    try:
-        return candidate.relative_to(base).as_posix()
-    except ValueError:
-        return candidate.as_posix()
+    return _relativize_path(Path(path), base)
 
 
-def _dedupe(items: List[str]) -> List[str]:
-    seen = set()
-    result: List[str] = []
-    for item in items:
-        if not item or item in seen:
-            continue
-        seen.add(item)
-        result.append(item)
-    return result
+def _relativize_path(candidate: PurePath, base: Path) -> str:
+    # Prefix test on the normalized POSIX strings: the same result as
+    # relative_to(), without building a path or raising on a mismatch.
+    path = candidate.as_posix()
+    prefix = base.as_posix()
+    if prefix == ".":
+        return path
+    if path == prefix:
+        return "."
+    if prefix != "/":
+        prefix += "/"
+    return path[len(prefix):] if path.startswith(prefix) else path
+
+
+def _quote_join(items: Iterable[str]) -> str:
+    """Quote each item and join with spaces; callers pass non-empty items."""
+    return '"' + '" "'.join(items) + '"'
+
+
+def _join_posix(directory: str, name: str) -> str:
+    """Join a file name onto a POSIX directory string as ``Path / name`` would."""
+    if directory == ".":
+        return name
+    if directory.endswith("/"):
+        return directory + name
+    return f"{directory}/{name}"
+
+
+def _sorted_unique(items: List[str]) -> List[str]:
+    # The IR builder already stores these lists sorted and deduplicated, so
+    # a C-level strictly-increasing check usually avoids the set and copy.
+    # islice walks the list in place where items[1:] would copy it.
+    if all(map(lt, items, islice(items, 1, None))):
+        return items
+    return sorted(set(items))
+
+
+def _dedupe(items: Iterable[str]) -> List[str]:
+    # dict.fromkeys keeps first-seen order; filter drops empty entries.
+    return list(filter(None, dict.fromkeys(items)))
 
 
 def _build_alias_lookup(targets: List[Target]) -> Dict[str, str]:
@@ -73,13 +150,18 @@ def _build_alias_lookup(targets: List[Target]) -> Dict[str, str]:
     for tgt in targets:
         if not tgt.alias:
             continue
+        # String slicing with the same results as Path(artifact).name/.stem.
+        name = tgt.artifact.rstrip("/").rpartition("/")[2]
+        dot = name.rfind(".")
+        stem = name[:dot] if 0 < dot < len(name) - 1 else name
         lookup[tgt.alias] = tgt.alias
         lookup[tgt.name] = tgt.alias
-        lookup[Path(tgt.artifact).stem] = tgt.alias
-        lookup[Path(tgt.artifact).name] = tgt.alias
+        lookup[stem] = tgt.alias
+        lookup[name] = tgt.alias
     return lookup
 
 
+@lru_cache(maxsize=None)
 def _global_interface_names(namespace: str) -> Tuple[str, str]:
     physical = f"{namespace.lower()}_global_options"
     alias = f"{namespace}::GlobalOptions"
@@ -95,19 +177,44 @@ def emit(
     diagnostics: DiagnosticCollector,
     unknown_factory: Optional[UnknownConstructFactory] = None,
 ) -> EmitResult:
-    unknown_factory = unknown_factory or UnknownConstructFactory()
-    layout = plan_file_layout(project, output_dir)
-    generated: List[GeneratedFile] = []
     unknown_constructs: List[UnknownConstruct] = []
+    files = _iter_generated_files(
+        project,
+        output_dir,
+        options,
+        diagnostics,
+        unknown_factory or UnknownConstructFactory(),
+        unknown_constructs,
+    )
+    if options.dry_run or options.retain_files:
+        generated = list(files)
+        if not options.dry_run:
+            _write_generated(generated, fs, diagnostics)
+        return EmitResult(generated_files=generated, unknown_constructs=unknown_constructs)
+    # Write as rendering proceeds so only one batch of contents is alive.
+    while batch := list(islice(files, _WRITE_BATCH)):
+        _write_generated(batch, fs, diagnostics)
+    return EmitResult(generated_files=[], unknown_constructs=unknown_constructs)
+
+
+def _iter_generated_files(
+    project: Project,
+    output_dir: Path,
+    options: EmitOptions,
+    diagnostics: DiagnosticCollector,
+    unknown_factory: UnknownConstructFactory,
+    unknown_constructs: List[UnknownConstruct],
+) -> Iterator[GeneratedFile]:
+    """Render planned files lazily, in write order, collecting unknowns."""
+    layout = plan_file_layout(project, output_dir)
     alias_lookup = _build_alias_lookup(project.targets)
     has_global_module = _has_global_module(project)
+    generated: List[GeneratedFile] = []
     global_interface_alias = _emit_global_module(
         project,
         output_dir,
         options,
         has_global_module,
-        fs,
-        diagnostics,
         alias_lookup,
         generated,
     )
@@ -122,27 +229,20 @@ def emit(
         diagnostics=diagnostics,
         unknown_factory=unknown_factory,
     )
-    _record_root_file(output_dir, fs, diagnostics, generated, root_result, options.dry_run)
+    _record_root_file(output_dir, generated, root_result)
     unknown_constructs.extend(root_result.unknown_constructs)
-    dir_results, nested_unknowns = _emit_directory_targets(
+    yield from generated
+    yield from _iter_directory_files(
         layout,
         output_dir,
-        options,
         alias_lookup,
         global_interface_alias,
         diagnostics,
         unknown_factory,
-        fs,
+        unknown_constructs,
     )
-    generated.extend(dir_results)
-    unknown_constructs.extend(nested_unknowns)
     if options.packaging:
-        generated.extend(
-            _emit_packaging_files(
-                project, options.namespace, has_global_module, output_dir, fs, diagnostics, options.dry_run
-            )
-        )
-    return EmitResult(generated_files=generated, unknown_constructs=unknown_constructs)
+        yield from _emit_packaging_files(project, options.namespace, has_global_module, output_dir)
 
 
 def _has_global_module(project: Project) -> bool:
@@ -160,12 +260,10 @@ def _emit_global_module(
     output_dir: Path,
     options: EmitOptions,
     has_global_module: bool,
-    fs: FileSystemAdapter,
-    diagnostics: DiagnosticCollector,
     alias_lookup: Dict[str, str],
     generated: List[GeneratedFile],
 ) -> Optional[str]:
-    has_global_interface = bool(project.project_config.includes or project.project_config.defines or project.project_config.flags)
+    has_global_interface = project.project_config.has_interface_requirements
     if not has_global_module:
         return None
     global_interface_name, global_alias_name = _global_interface_names(options.namespace)
@@ -174,95 +272,72 @@ def _emit_global_module(
         alias_lookup.setdefault(global_interface_name, global_alias_name)
         alias_lookup.setdefault(global_alias_name, global_alias_name)
         global_interface_alias = global_alias_name
-    global_module_path = output_dir / GLOBAL_MODULE_NAME
     global_content = render_global_module(
         project.project_config,
         options.namespace,
         interface_name=global_interface_name,
         alias=global_alias_name,
     )
-    generated.append(GeneratedFile(path=global_module_path.as_posix(), content=global_content))
-    if not options.dry_run:
-        try:
-            fs.makedirs(global_module_path.parent)
-            fs.write_text(global_module_path, global_content)
-        except (OSError, PermissionError) as exc:  # pragma: no cover - IO error path
-            add(diagnostics, "ERROR", "EMIT_WRITE_FAIL", f"Failed to write {global_module_path}: {exc}")
+    global_path = _join_posix(output_dir.as_posix(), GLOBAL_MODULE_NAME)
+    generated.append(GeneratedFile(path=global_path, content=global_content))
     return global_interface_alias
 
 
-def _collect_subdirs(layout: Dict[Path, List[Target]], output_dir: Path) -> List[str]:
-    subdirs = []
-    for dirpath in sorted(layout, key=lambda p: Path(p).as_posix()):
-        if dirpath == output_dir:
+def _collect_subdirs(layout: Dict[str, List[Target]], output_dir: Path) -> List[str]:
+    root = _layout_root(output_dir)
+    prefix = root if root.endswith("/") else root + "/"
+    subdirs = set()
+    for dirpath in layout:
+        if dirpath == root:
             continue
-        try:
-            rel = Path(dirpath).relative_to(output_dir).as_posix()
-        except ValueError:
-            rel = Path(dirpath).name
-        subdirs.append(rel)
-    return sorted(set(subdirs))
+        if root == ".":
+            subdirs.add(dirpath if not dirpath.startswith("../") else posixpath.basename(dirpath))
+        elif dirpath.startswith(prefix):
+            subdirs.add(dirpath[len(prefix):])
+        else:
+            subdirs.add(posixpath.basename(dirpath))
+    return sorted(subdirs)
 
 
 def _record_root_file(
     output_dir: Path,
-    fs: FileSystemAdapter,
-    diagnostics: DiagnosticCollector,
     generated: List[GeneratedFile],
     root_result: RenderResult,
-    dry_run: bool,
 ) -> None:
-    root_content = root_result.rendered
-    root_path = output_dir / "CMakeLists.txt"
-    generated.append(GeneratedFile(path=root_path.as_posix(), content=root_content))
-    if dry_run:
-        return
-    try:
-        fs.makedirs(root_path.parent)
-        fs.write_text(root_path, root_content)
-    except (OSError, PermissionError) as exc:  # pragma: no cover - IO error path
-        add(diagnostics, "ERROR", "EMIT_WRITE_FAIL", f"Failed to write {root_path}: {exc}")
+    root_path = _join_posix(output_dir.as_posix(), "CMakeLists.txt")
+    generated.append(GeneratedFile(path=root_path, content=root_result.rendered))
 
 
-def _emit_directory_targets(
-    layout: Dict[Path, List[Target]],
+def _iter_directory_files(
+    layout: Dict[str, List[Target]],
     output_dir: Path,
-    options: EmitOptions,
     alias_lookup: Dict[str, str],
     global_interface_alias: Optional[str],
     diagnostics: DiagnosticCollector,
     unknown_factory: UnknownConstructFactory,
-    fs: FileSystemAdapter,
-) -> Tuple[List[GeneratedFile], List[UnknownConstruct]]:
-    generated: List[GeneratedFile] = []
-    unknowns: List[UnknownConstruct] = []
+    unknowns: List[UnknownConstruct],
+) -> Iterator[GeneratedFile]:
+    root = _layout_root(output_dir)
     for dirpath, targets in layout.items():
-        rel_dir = Path(dirpath)
-        if rel_dir == output_dir:
+        if dirpath == root:
             continue
-        path = rel_dir / "CMakeLists.txt"
-        rendered_targets = []
-        for target in targets:
-            result = render_target(
-                target,
-                rel_dir,
-                options.namespace,
-                alias_lookup=alias_lookup,
-                global_link=global_interface_alias,
-                diagnostics=diagnostics,
-                unknown_factory=unknown_factory,
+        rel_dir = Path(dirpath)
+        out = io.StringIO()
+        for index, target in enumerate(targets):
+            if index:
+                out.write("\n")
+            unknowns.extend(
+                _write_target(
+                    out,
+                    target,
+                    rel_dir,
+                    alias_lookup=alias_lookup,
+                    global_link=global_interface_alias,
+                    diagnostics=diagnostics,
+                    unknown_factory=unknown_factory,
+                )
             )
-            rendered_targets.append(result.rendered)
-            unknowns.extend(result.unknown_constructs)
-        content = "\n".join(rendered_targets)
-        generated.append(GeneratedFile(path=path.as_posix(), content=content))
-        if not options.dry_run:
-            try:
-                fs.makedirs(path.parent)
-                fs.write_text(path, content)
-            except (OSError, PermissionError) as exc:  # pragma: no cover
-                add(diagnostics, "ERROR", "EMIT_WRITE_FAIL", f"Failed to write {path}: {exc}")
-    return generated, unknowns
+        yield GeneratedFile(path=_join_posix(dirpath, "CMakeLists.txt"), content=out.getvalue())
 
 
 def _emit_packaging_files(
@@ -270,23 +345,91 @@ def _emit_packaging_files(
     namespace: str,
     has_global_module: bool,
     output_dir: Path,
-    fs: FileSystemAdapter,
-    diagnostics: DiagnosticCollector,
-    dry_run: bool,
 ) -> List[GeneratedFile]:
-    generated: List[GeneratedFile] = []
     pkg_files = render_packaging(project, namespace, has_global_module=has_global_module)
-    for fname, content in pkg_files.items():
-        full_path = output_dir / fname
-        generated.append(GeneratedFile(path=full_path.as_posix(), content=content))
-        if dry_run:
-            continue
+    output_posix = output_dir.as_posix()
+    return [
+        GeneratedFile(path=_join_posix(output_posix, fname), content=content)
+        for fname, content in pkg_files.items()
+    ]
+
+
+def _write_generated(
+    generated: List[GeneratedFile],
+    fs: FileSystemAdapter,
+    diagnostics: DiagnosticCollector,
+) -> None:
+    """Write planned files whose content changed, creating each parent once.
+
+    Writes to the local filesystem overlap on a small thread pool; other
+    adapters are written in order so in-memory mtimes stay deterministic.
+    Failures are reported per file, in plan order.
+    """
+    paths = [Path(item.path) for item in generated]
+    failures: Dict[Path, OSError] = {}
+    for parent in sorted({path.parent for path in paths}, key=Path.as_posix):
+        try:
+            fs.makedirs(parent)
+        except OSError as exc:  # pragma: no cover - IO error path
+            failures[parent] = exc
+    pending = [
+        (path, item.content)
+        for path, item in zip(paths, generated)
+        if path.parent not in failures
+    ]
+
+    def write(entry: Tuple[Path, str]) -> Optional[OSError]:
+        try:
+            _write_if_changed(fs, *entry)
+        except OSError as exc:
+            return exc
+        return None
+
+    if isinstance(fs, LocalFS) and len(pending) > 1:
+        with ThreadPoolExecutor(max_workers=min(_WRITE_WORKERS, len(pending))) as executor:
+            outcomes = list(executor.map(write, pending))
+    else:
+        outcomes = [write(entry) for entry in pending]
+    for (path, _), exc in zip(pending, outcomes):
+        if exc is not None:
+            failures[path] = exc
+    for path in paths:
+        exc = failures.get(path, failures.get(path.parent))
+        if exc is not None:
+            add(diagnostics, "ERROR", "EMIT_WRITE_FAIL", f"Failed to write {path}: {exc}")
+
+
+def _write_if_changed(fs: FileSystemAdapter, path: Path, content: str) -> None:
+    """Write ``content`` unless ``path`` already holds exactly that text.
+
+    Leaving identical files untouched keeps their mtimes, so re-running the
+    conversion does not make CMake reconfigure. Unreadable files are
+    rewritten.
+    """
+    if isinstance(fs, LocalFS):
+        if _local_file_matches(path, content):
+            return
+    else:
         try:
-            fs.makedirs(full_path.parent)
-            fs.write_text(full_path, content)
-        except (OSError, PermissionError) as exc:  # pragma: no cover
-            add(diagnostics, "ERROR", "EMIT_WRITE_FAIL", f"Failed to write {full_path}: {exc}")
-    return generated
+            if fs.exists(path) and fs.read_text(path) == content:
+                return
+        except (OSError, UnicodeDecodeError):
+            pass
+    fs.write_text(path, content)
+
+
+def _local_file_matches(path: Path, content: str) -> bool:
+    # Compare against the bytes LocalFS.write_text would produce. One stat
+    # settles missing files and size changes; only same-size files are read.
+    if os.linesep != "\n":
+        content = content.replace("\n", os.linesep)
+    expected = content.encode("utf-8")
+    try:
+        if path.stat().st_size != len(expected):
+            return False
+        return path.read_bytes() == expected
+    except OSError:
+        return False
 
 
 def render_root(
@@ -302,86 +445,97 @@ def render_root(
 ) -> RenderResult:
     unknown_factory = unknown_factory or UnknownConstructFactory()
     unknown_constructs: List[UnknownConstruct] = []
-    lines = [
-        "cmake_minimum_required(VERSION 3.20)",
-        f'project({project.name} LANGUAGES {" ".join(project.languages)})',
-    ]
+    out = io.StringIO()
+    out.write("cmake_minimum_required(VERSION 3.20)\n")
+    out.write(f'project({project.name} LANGUAGES {" ".join(project.languages)})\n')
     if has_global_module:
-        lines.append(f'include("${{CMAKE_CURRENT_LIST_DIR}}/{GLOBAL_MODULE_NAME}")')
-    for sub in subdirs:
-        lines.append(f'add_subdirectory("{sub}")')
+        out.write(f"{_GLOBAL_MODULE_INCLUDE}\n")
+    out.writelines(f'add_subdirectory("{sub}")\n' for sub in subdirs)
+    root_dir = Path(".")
     for target in project.targets:
-        if target.sources and Path(target.sources[0].path).parent.as_posix() == ".":
-            result = render_target(
-                target,
-                Path("."),
-                options.namespace,
-                alias_lookup=alias_lookup,
-                global_link=global_link,
-                diagnostics=diagnostics,
-                unknown_factory=unknown_factory,
+        if _renders_in_root(target):
+            unknown_constructs.extend(
+                _write_target(
+                    out,
+                    target,
+                    root_dir,
+                    alias_lookup=alias_lookup,
+                    global_link=global_link,
+                    diagnostics=diagnostics,
+                    unknown_factory=unknown_factory,
+                )
             )
-            lines.append(result.rendered)
-            unknown_constructs.extend(result.unknown_constructs)
+            # Each target block is followed by a blank line.
+            out.write("\n")
     if options.packaging:
-        lines.append(f'include("${{CMAKE_CURRENT_LIST_DIR}}/{PACKAGING_RULES_FILE}")')
-    return RenderResult(rendered="\n".join(lines) + "\n", unknown_constructs=unknown_constructs)
+        out.write(f"{_PACKAGING_RULES_INCLUDE}\n")
+    return RenderResult(rendered=out.getvalue(), unknown_constructs=unknown_constructs)
+
+
+def _renders_in_root(target: Target) -> bool:
+    if target.sources:
+        return target.sources[0].parent == _CURRENT_DIR
+    # plan_file_layout keeps sourceless targets in output_dir, whose file is
+    # the root one; libraries among them are rendered as INTERFACE targets.
+    return target.type in _TARGET_RENDERERS
 
 
 def render_global_module(project_config, namespace: str, *, interface_name: str, alias: str) -> str:
-    lines = ["# Project global configuration"]
-    lines.extend(_render_feature_toggles(project_config))
-    lines.extend(_render_global_vars(project_config))
-    lines.extend(_render_flag_initializers(project_config))
-    lines.extend(_render_global_interface(project_config, interface_name, alias))
-    return "\n".join(lines) + "\n"
-
-
-def _render_feature_toggles(project_config) -> List[str]:
-    lines: List[str] = []
-    for name, value in sorted(project_config.feature_toggles.items()):
-        if isinstance(value, bool):
-            default = "ON" if value else "OFF"
-            lines.append(f'option({name} "Feature toggle from Make" {default})')
-        else:
-            lines.append(f'set({name} "{value}" CACHE STRING "Feature toggle from Make")')
-    return lines
+    # One join over chained generators; no per-section lists are built.
+    lines = chain(
+        ("# Project global configuration",),
+        _render_feature_toggles(project_config),
+        _render_global_vars(project_config),
+        _render_flag_initializers(project_config),
+        _render_global_interface(project_config, interface_name, alias),
+        ("",),
+    )
+    return "\n".join(lines)
 
 
-def _render_global_vars(project_config) -> List[str]:
-    return [f"set({name} \"{value}\" CACHE STRING \"Global var from Make\")" for name, value in sorted(project_config.vars.items())]
+def _render_feature_toggles(project_config) -> Iterator[str]:
+    # One pass in name order: boolean toggles become options, others cache strings.
+    return (
+        f'option({name} "Feature toggle from Make" {"ON" if value else "OFF"})'
+        if isinstance(value, bool)
+        else f'set({name} "{value}" CACHE STRING "Feature toggle from Make")'
+        for name, value in sorted(project_config.feature_toggles.items())
+    )
 
 
-def _render_flag_initializers(project_config) -> List[str]:
-    lines: List[str] = []
+def _render_global_vars(project_config) -> Iterator[str]:
+    return (
+        f"set({name} \"{value}\" CACHE STRING \"Global var from Make\")"
+        for name, value in sorted(project_config.vars.items())
+    )
+
+
+def _render_flag_initializers(project_config) -> Iterator[str]:
     for lang, flags in sorted(project_config.flags.items()):
-        init_var = {"c": "C", "cpp": "CXX"}.get(lang, lang.upper())
-        lines.append(f"set(CMAKE_{init_var}_FLAGS_INIT \"{' '.join(flags)}\")")
-    return lines
+        init_var = _FLAG_INIT_LANGUAGES.get(lang) or lang.upper()
+        yield f"set(CMAKE_{init_var}_FLAGS_INIT \"{' '.join(flags)}\")"
 
 
-def _render_global_interface(project_config, interface_name: str, alias: str) -> List[str]:
-    needs_interface = bool(project_config.includes or project_config.defines or project_config.flags)
-    if not needs_interface:
-        return []
-    lines: List[str] = [f"add_library({interface_name} INTERFACE)"]
+def _render_global_interface(project_config, interface_name: str, alias: str) -> Iterator[str]:
+    if not project_config.has_interface_requirements:
+        return
+    yield f"add_library({interface_name} INTERFACE)"
     include_line = _format_interface_includes(project_config.includes, interface_name)
     if include_line:
-        lines.append(include_line)
+        yield include_line
     defines_line = _format_interface_defines(project_config.defines, interface_name)
     if defines_line:
-        lines.append(defines_line)
+        yield defines_line
     flags_line = _format_interface_flags(project_config.flags, interface_name)
     if flags_line:
-        lines.append(flags_line)
-    lines.append(f"add_library({alias} ALIAS {interface_name})")
-    return lines
+        yield flags_line
+    yield f"add_library({alias} ALIAS {interface_name})"
 
 
 def _format_interface_includes(includes: List[str], interface_name: str) -> Optional[str]:
     if not includes:
         return None
-    formatted = " ".join(f'"{inc}"' for inc in sorted(set(includes)))
+    formatted = _quote_join(sorted(set(includes)))
     return f"target_include_directories({interface_name} INTERFACE {formatted})"
 
 
@@ -409,80 +563,129 @@ def render_target(
     diagnostics: Optional[DiagnosticCollector] = None,
     unknown_factory: Optional[UnknownConstructFactory] = None,
 ) -> RenderResult:
-    unknown_factory = unknown_factory or UnknownConstructFactory()
-    unknown_constructs: List[UnknownConstruct] = []
-    lines: List[str] = []
+    out = io.StringIO()
+    unknown_constructs = _write_target(
+        out,
+        target,
+        rel_dir,
+        alias_lookup=alias_lookup,
+        global_link=global_link,
+        diagnostics=diagnostics,
+        unknown_factory=unknown_factory or UnknownConstructFactory(),
+    )
+    return RenderResult(rendered=out.getvalue(), unknown_constructs=unknown_constructs)
+
+
+def _write_target(
+    out: io.StringIO,
+    target: Target,
+    rel_dir: Path,
+    *,
+    alias_lookup: Optional[Dict[str, str]],
+    global_link: Optional[str],
+    diagnostics: Optional[DiagnosticCollector],
+    unknown_factory: UnknownConstructFactory,
+) -> List[UnknownConstruct]:
+    """Write one target's commands to ``out``, returning unknowns raised."""
+    renderer = _TARGET_RENDERERS.get(target.type)
+    if renderer is None:
+        out.write("# Unknown target type\n")
+        return [_handle_unknown_target_type(target, rel_dir, diagnostics, unknown_factory)]
+
     scope = _usage_scope(target)
+    if not target.sources and target.type in _LIBRARY_TYPES:
+        # CMake rejects a compiled library without sources, so a header-only
+        # library is emitted as an INTERFACE target instead.
+        renderer = _write_interface_target
+        scope = "INTERFACE"
+    if not _has_usage_requirements(target, global_link):
+        # Thin targets (typically interface/imported wrappers) skip the
+        # sort/dedupe work entirely; every requirement list is empty.
+        empty: List[str] = []
+        renderer(out, target, rel_dir, scope, empty, empty, empty, empty, empty)
+        _write_custom_commands(out, target, rel_dir)
+        return []
+
     link_items = _build_link_items(target, global_link, alias_lookup)
-    includes = sorted(set(target.include_dirs))
-    defines = sorted(set(target.defines))
-    compile_opts = sorted(set(target.compile_options))
-    link_opts = sorted(set(target.link_options))
-
-    renderers = {
-        "executable": _render_binary_target,
-        "shared": _render_binary_target,
-        "static": _render_binary_target,
-        "object": _render_binary_target,
-        "interface": _render_interface_target,
-        "imported": _render_imported_target,
-    }
+    includes = _sorted_unique(target.include_dirs)
+    defines = _sorted_unique(target.defines)
+    compile_opts = _sorted_unique(target.compile_options)
+    link_opts = _sorted_unique(target.link_options)
+
+    renderer(
+        out,
+        target,
+        rel_dir,
+        scope,
+        includes,
+        defines,
+        compile_opts,
+        link_opts,
+        link_items,
+    )
+    _write_custom_commands(out, target, rel_dir)
+    return []
 
-    renderer = renderers.get(target.type)
-    if renderer is None:
-        return _handle_unknown_target_type(target, rel_dir, diagnostics, unknown_factory, unknown_constructs)
-
-    lines.extend(
-        renderer(
-            target,
-            rel_dir,
-            scope,
-            includes,
-            defines,
-            compile_opts,
-            link_opts,
-            link_items,
-        )
+
+def _has_usage_requirements(target: Target, global_link: Optional[str]) -> bool:
+    return bool(
+        target.include_dirs
+        or target.defines
+        or target.compile_options
+        or target.link_options
+        or target.deps
+        or target.link_libs
+        or (global_link and target.type != "imported")
     )
-    lines.extend(_render_custom_commands(target, rel_dir))
-    return RenderResult(rendered="\n".join(lines) + "\n", unknown_constructs=unknown_constructs)
 
 
 def _build_link_items(
     target: Target, global_link: Optional[str], alias_lookup: Optional[Dict[str, str]]
 ) -> List[str]:
-    link_items: List[str] = []
-    if global_link and target.type not in {"imported"}:
-        link_items.append(global_link)
-    link_items.extend(sorted(target.deps))
-    link_items.extend(sorted(target.link_libs))
+    link_items: Iterable[str] = chain(
+        (global_link,) if global_link and target.type != "imported" else (),
+        _sorted_unique(target.deps),
+        _sorted_unique(target.link_libs),
+    )
     if alias_lookup:
-        link_items = [alias_lookup.get(item, item) for item in link_items]
+        link_items = (alias_lookup.get(item, item) for item in link_items)
     return _dedupe(link_items)
 
 
-def _render_custom_commands(target: Target, rel_dir: Path) -> List[str]:
-    lines: List[str] = []
+def _write_custom_commands(out: io.StringIO, target: Target, rel_dir: Path) -> None:
     for cc in target.custom_commands:
-        lines.append(f"# Custom command for {target.name}")
+        out.write(f"# Custom command for {target.name}\n")
         if not cc.commands:
             continue
-        outputs_str = " ".join(f'"{_relativize(o, rel_dir)}"' for o in cc.outputs) if cc.outputs else target.name
-        inputs_str = " ".join(f'"{_relativize(i, rel_dir)}"' for i in cc.inputs) if cc.inputs else ""
-        command_str = " && ".join(cc.commands)
-        lines.append(f'add_custom_command(OUTPUT {outputs_str}')
-        if inputs_str:
-            lines.append(f'  DEPENDS {inputs_str}')
-        lines.append(f'  COMMAND {command_str})')
-    return lines
-
-
-def _render_unknown(unknown_constructs: List[UnknownConstruct], uc: UnknownConstruct) -> RenderResult:
-    unknown_constructs.append(uc)
-    return RenderResult(rendered="# Unknown target type\n", unknown_constructs=unknown_constructs)
+        # Without outputs the target name stands in; otherwise it stays out
+        # of the cache key so targets sharing a rule share the block.
+        unnamed_output = "" if cc.outputs else target.name
+        out.write(
+            _custom_command_block(
+                tuple(cc.outputs), tuple(cc.inputs), tuple(cc.commands), rel_dir, unnamed_output
+            )
+        )
 
 
-def _usage_requirements(
+@lru_cache(maxsize=4096)
+def _custom_command_block(
+    outputs: Tuple[str, ...],
+    inputs: Tuple[str, ...],
+    commands: Tuple[str, ...],
+    rel_dir: Path,
+    unnamed_output: str,
+) -> str:
+    # A Make rule matched by several targets attaches the same command to
+    # each of them, so identical blocks are formatted once.
+    outputs_str = unnamed_output or _quote_join(_relativize(o, rel_dir) for o in outputs)
+    block = f"add_custom_command(OUTPUT {outputs_str}\n"
+    if inputs:
+        block += f"  DEPENDS {_quote_join(_relativize(i, rel_dir) for i in inputs)}\n"
+    return f"{block}  COMMAND {' && '.join(commands)})\n"
+
+
+def _write_usage_requirements(
+    out: io.StringIO,
     name: str,
     scope: str,
     includes: List[str],
@@ -491,23 +694,22 @@ def _usage_requirements(
     link_opts: List[str],
     link_items: List[str],
     rel_dir: Path,
-) -> List[str]:
-    lines: List[str] = []
+) -> None:
     if includes:
-        parts = " ".join(f'"{_relativize(inc, rel_dir)}"' for inc in includes)
-        lines.append(f"target_include_directories({name} {scope} {parts})")
+        parts = _quote_join(_relativize(inc, rel_dir) for inc in includes)
+        out.write(f"target_include_directories({name} {scope} {parts})\n")
     if defines:
-        lines.append(f"target_compile_definitions({name} {scope} {' '.join(defines)})")
+        out.write(f"target_compile_definitions({name} {scope} {' '.join(defines)})\n")
     if compile_opts:
-        lines.append(f"target_compile_options({name} {scope} {' '.join(compile_opts)})")
+        out.write(f"target_compile_options({name} {scope} {' '.join(compile_opts)})\n")
     if link_opts:
-        lines.append(f"target_link_options({name} {scope} {' '.join(link_opts)})")
+        out.write(f"target_link_options({name} {scope} {' '.join(link_opts)})\n")
     if link_items:
-        lines.append(f"target_link_libraries({name} {scope} {' '.join(link_items)})")
-    return lines
+        out.write(f"target_link_libraries({name} {scope} {' '.join(link_items)})\n")
 
 
-def _render_binary_target(
+def _write_binary_target(
+    out: io.StringIO,
     target: Target,
     rel_dir: Path,
     scope: str,
@@ -516,28 +718,21 @@ def _render_binary_target(
     compile_opts: List[str],
     link_opts: List[str],
     link_items: List[str],
-) -> List[str]:
-    cmake_fn = {"executable": "add_executable", "shared": "add_library", "static": "add_library", "object": "add_library"}[
-        target.type
-    ]
-    libtype = ""
-    if target.type == "shared":
-        libtype = " SHARED"
-    elif target.type == "static":
-        libtype = " STATIC"
-    elif target.type == "object":
-        libtype = " OBJECT"
-    lines = [f"{cmake_fn}({target.name}{libtype})"]
-    if target.sources and target.type not in {"interface", "imported"}:
-        srcs = " ".join(f'"{_relativize(s.path, rel_dir)}"' for s in target.sources)
-        lines.append(f"target_sources({target.name} PRIVATE {srcs})")
-    lines.extend(_usage_requirements(target.name, scope, includes, defines, compile_opts, link_opts, link_items, rel_dir))
-    if target.alias and target.type in {"shared", "static", "object"}:
-        lines.append(f"add_library({target.alias} ALIAS {target.name})")
-    return lines
-
-
-def _render_interface_target(
+) -> None:
+    cmake_fn, libtype = _BINARY_TARGET_COMMANDS[target.type]
+    out.write(f"{cmake_fn}({target.name}{libtype})\n")
+    if target.sources:
+        srcs = _quote_join(_relativize_path(s.path_obj, rel_dir) for s in target.sources)
+        out.write(f"target_sources({target.name} PRIVATE {srcs})\n")
+    _write_usage_requirements(
+        out, target.name, scope, includes, defines, compile_opts, link_opts, link_items, rel_dir
+    )
+    if target.alias and target.type in _LIBRARY_TYPES:
+        out.write(f"add_library({target.alias} ALIAS {target.name})\n")
+
+
+def _write_interface_target(
+    out: io.StringIO,
     target: Target,
     rel_dir: Path,
     scope: str,
@@ -546,15 +741,17 @@ def _render_interface_target(
     compile_opts: List[str],
     link_opts: List[str],
     link_items: List[str],
-) -> List[str]:
-    lines = [f"add_library({target.name} INTERFACE)"]
-    lines.extend(_usage_requirements(target.name, scope, includes, defines, compile_opts, link_opts, link_items, rel_dir))
+) -> None:
+    out.write(f"add_library({target.name} INTERFACE)\n")
+    _write_usage_requirements(
+        out, target.name, scope, includes, defines, compile_opts, link_opts, link_items, rel_dir
+    )
     if target.alias:
-        lines.append(f"add_library({target.alias} ALIAS {target.name})")
-    return lines
+        out.write(f"add_library({target.alias} ALIAS {target.name})\n")
 
 
-def _render_imported_target(
+def _write_imported_target(
+    out: io.StringIO,
     target: Target,
     rel_dir: Path,
     scope: str,
@@ -563,10 +760,18 @@ def _render_imported_target(
     compile_opts: List[str],
     link_opts: List[str],
     link_items: List[str],
-) -> List[str]:
-    lines = [f"add_library({target.name} UNKNOWN IMPORTED)"]
-    lines.extend(_usage_requirements(target.name, scope, includes, defines, compile_opts, link_opts, link_items, rel_dir))
-    return lines
+) -> None:
+    out.write(f"add_library({target.name} UNKNOWN IMPORTED)\n")
+    _write_usage_requirements(
+        out, target.name, scope, includes, defines, compile_opts, link_opts, link_items, rel_dir
+    )
+
+
+_TARGET_RENDERERS = {
+    **dict.fromkeys(_BINARY_TARGET_COMMANDS, _write_binary_target),
+    "interface": _write_interface_target,
+    "imported": _write_imported_target,
+}
 
 
 def _handle_unknown_target_type(
@@ -574,11 +779,10 @@ def _handle_unknown_target_type(
     rel_dir: Path,
     diagnostics: Optional[DiagnosticCollector],
     unknown_factory: UnknownConstructFactory,
-    unknown_constructs: List[UnknownConstruct],
-) -> RenderResult:
+) -> UnknownConstruct:
     if diagnostics is not None:
         add(diagnostics, "ERROR", "EMIT_UNKNOWN_TYPE", f"Unknown target type {target.type}")
-    uc = unknown_factory.create(
+    return unknown_factory.create(
         category="toolchain_specific",
         file=rel_dir.as_posix(),
         raw_snippet=target.type,
@@ -588,14 +792,14 @@ def _handle_unknown_target_type(
         cmake_status="not_generated",
         suggested_action="manual_review",
     )
-    return _render_unknown(unknown_constructs, uc)
 
 
 def render_packaging(project: Project, namespace: str, *, has_global_module: bool) -> Dict[str, str]:
-    export_name = f"{project.name}Targets"
-    config_name = f"{project.name}Config.cmake"
-    version_name = f"{project.name}ConfigVersion.cmake"
-    destination = f"lib/cmake/{project.name}"
+    name = project.name
+    export_name = f"{name}Targets"
+    config_name = f"{name}Config.cmake"
+    version_name = f"{name}ConfigVersion.cmake"
+    destination = f"lib/cmake/{name}"
     version_value = project.version or "0.1.0"
 
     installable = _collect_installable_targets(project, namespace, has_global_module)
@@ -611,8 +815,8 @@ def render_packaging(project: Project, namespace: str, *, has_global_module: boo
 
 
 def _collect_installable_targets(project: Project, namespace: str, has_global_module: bool) -> List[str]:
-    installable = sorted({t.name for t in project.targets if t.type in {"shared", "static", "executable", "interface", "object"}})
-    if has_global_module and (project.project_config.includes or project.project_config.defines or project.project_config.flags):
+    installable = sorted({t.name for t in project.targets if t.type in _INSTALLABLE_TYPES})
+    if has_global_module and project.project_config.has_interface_requirements:
         global_interface, _ = _global_interface_names(namespace)
         installable = sorted(set(installable + [global_interface]))
     return installable
@@ -627,14 +831,17 @@ def _render_packaging_rules(
     version_name: str,
     has_global_module: bool,
 ) -> List[str]:
+    namespace = project.namespace
     packaging_lines = [f"# Packaging for {project.name}"]
     if installable:
         packaging_lines.append(f"install(TARGETS {' '.join(installable)} EXPORT {export_name})")
     packaging_lines.append(
-        f"install(EXPORT {export_name} NAMESPACE {project.namespace}:: DESTINATION {destination} FILE {project.name}Targets.cmake)"
+        f"install(EXPORT {export_name} NAMESPACE {namespace}:: "
+        f"DESTINATION {destination} FILE {export_name}.cmake)"
     )
     packaging_lines.append(
-        f"export(EXPORT {export_name} FILE \"${{CMAKE_CURRENT_BINARY_DIR}}/{project.name}Targets.cmake\" NAMESPACE {project.namespace}::)"
+        f"export(EXPORT {export_name} "
+        f"FILE \"${{CMAKE_CURRENT_BINARY_DIR}}/{export_name}.cmake\" NAMESPACE {namespace}::)"
     )
     files_to_install = [config_name, version_name]
     if has_global_module:
@@ -648,44 +855,56 @@ def _render_packaging_rules(
 
 
 def _render_config_lines(project: Project, namespace: str, has_global_module: bool) -> List[str]:
-    config_lines = [f"# Config for {project.name}"]
+    name = project.name
+    config_lines = [f"# Config for {name}"]
     if has_global_module:
-        config_lines.append(f'include("${{CMAKE_CURRENT_LIST_DIR}}/{GLOBAL_MODULE_NAME}")')
-    config_lines.append(f'include("${{CMAKE_CURRENT_LIST_DIR}}/{project.name}Targets.cmake")')
-    config_lines.append(f'set({project.name.upper()}_NAMESPACE "{namespace}::")')
+        config_lines.append(_GLOBAL_MODULE_INCLUDE)
+    config_lines.append(f'include("${{CMAKE_CURRENT_LIST_DIR}}/{name}Targets.cmake")')
+    config_lines.append(f'set({name.upper()}_NAMESPACE "{namespace}::")')
     return config_lines
 
 
 def _render_version_lines(version_value: str) -> List[str]:
-    return [
-        f'set(PACKAGE_VERSION "{version_value}")',
-        "if(PACKAGE_FIND_VERSION)",
-        "  if(PACKAGE_VERSION VERSION_LESS PACKAGE_FIND_VERSION)",
-        "    set(PACKAGE_VERSION_COMPATIBLE FALSE)",
-        "  else()",
-        "    set(PACKAGE_VERSION_COMPATIBLE TRUE)",
-        "    if(PACKAGE_FIND_VERSION STREQUAL PACKAGE_VERSION)",
-        "      set(PACKAGE_VERSION_EXACT TRUE)",
-        "    endif()",
-        "  endif()",
-        "endif()",
-    ]
+    return [f'set(PACKAGE_VERSION "{version_value}")', *_VERSION_COMPAT_LINES]
+
 
+def _layout_root(output_dir: Path) -> str:
+    return posixpath.normpath(output_dir.as_posix())
 
-def plan_file_layout(project: Project, output_dir: Path) -> Dict[Path, List[Target]]:
-    layout: Dict[Path, List[Target]] = {output_dir: []}
+
+def _layout_dir(root: str, dir_rel: PurePath, cwd: Path) -> str:
+    if dir_rel.is_absolute():
+        try:
+            dir_rel = dir_rel.relative_to(cwd)
+        except ValueError:
+            dir_rel = PurePosixPath(dir_rel.name)
+    # Lexical normalization only: no filesystem access per directory.
+    return posixpath.normpath(f"{root}/{dir_rel.as_posix()}")
+
+
+def plan_file_layout(project: Project, output_dir: Path) -> Dict[str, List[Target]]:
+    """Group targets by output directory, keyed by normalized POSIX path strings.
+
+    Keys are sorted as strings, so ``output_dir``'s own key (always present,
+    and where targets without sources go) need not come first; callers look
+    it up by value.
+    """
+    root = _layout_root(output_dir)
+    layout: Dict[str, List[Target]] = {root: []}
+    cwd = Path.cwd()
+    # Many targets share a source directory, so each one is mapped only once.
+    layout_dirs: Dict[PurePath, str] = {}
     for target in project.targets:
-        dirs = [Path(s.path).parent for s in target.sources] if target.sources else [Path(".")]
-        dir_rel = Path(".")
-        if dirs:
-            dir_rel = min((Path(d) for d in dirs), key=lambda p: p.as_posix())
-        if dir_rel.is_absolute():
-            try:
-                dir_rel = dir_rel.relative_to(Path(".").resolve())
-            except ValueError:
-                dir_rel = Path(dir_rel.name)
-        abs_dir = (output_dir / dir_rel).resolve()
+        dir_rel: PurePath = _CURRENT_DIR
+        if target.sources:
+            # Source parents are PurePosixPath, whose str() is already posix.
+            dir_rel = min((s.parent for s in target.sources), key=str)
+        abs_dir = layout_dirs.get(dir_rel)
+        if abs_dir is None:
+            abs_dir = layout_dirs[dir_rel] = _layout_dir(root, dir_rel, cwd)
         layout.setdefault(abs_dir, []).append(target)
-    for dirpath, targets in layout.items():
-        layout[dirpath] = sorted(targets, key=lambda t: t.name)
-    return dict(sorted(layout.items(), key=lambda item: item[0].as_posix()))
+    # Targets usually arrive in name order already, and an in-place timsort
+    # of a sorted run is a single linear scan with no copy.
+    for targets in layout.values():
+        targets.sort(key=_target_name)
+    return dict(sorted(layout.items()))
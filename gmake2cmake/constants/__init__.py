@@ -15,6 +15,9 @@ REPORT_JSON_FILENAME = "report.json"
 # Markdown reporter output filename
 REPORT_MD_FILENAME = "report.md"
 
+# Per-user cache of parsed/evaluated Makefiles, under $XDG_CACHE_HOME or ~/.cache
+ANALYSIS_CACHE_SUBDIR = "gmake2cmake/analysis"
+
 # Default project name
 DEFAULT_PROJECT_NAME = "Project"
 
@@ -72,6 +75,7 @@ __all__ = [
     "DEFAULT_OUTPUT_DIR",
     "REPORT_JSON_FILENAME",
     "REPORT_MD_FILENAME",
+    "ANALYSIS_CACHE_SUBDIR",
     "DEFAULT_PROJECT_NAME",
     "UNKNOWN_CONSTRUCT_PHASE_PARSE",
     "UNKNOWN_CONSTRUCT_SEVERITY_WARNING",
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Iterable, List, Optional, TextIO
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, List, Optional, Set, TextIO
 
 from gmake2cmake.constants import VALID_DIAGNOSTIC_SEVERITIES
 from gmake2cmake.types import DiagnosticDict
@@ -13,7 +14,7 @@ if TYPE_CHECKING:
 Severity = str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Diagnostic:
     """A single diagnostic message with severity, code, and location.
 
@@ -24,6 +25,8 @@ class Diagnostic:
         location: Optional file:line:column location
         origin: Optional origin module identifier
         line: Optional source line text for additional context
+        unknown_id: Id of the unknown construct the diagnostic reports; when
+            set, the message starts with that id
     """
 
     severity: Severity
@@ -32,6 +35,7 @@ class Diagnostic:
     location: Optional[str] = None
     origin: Optional[str] = None
     line: Optional[str] = None
+    unknown_id: Optional[str] = None
 
     def __post_init__(self) -> None:
         if self.severity not in VALID_DIAGNOSTIC_SEVERITIES:
@@ -55,6 +59,12 @@ class DiagnosticCollector:
     """
 
     diagnostics: List[Diagnostic] = field(default_factory=list)
+    # Incremental ERROR-code index maintained by error_codes(); see there.
+    _error_codes: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    _scanned: int = field(default=0, init=False, repr=False, compare=False)
+    _scanned_list: Optional[List[Diagnostic]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
 
 _SEVERITY_ORDER = {"ERROR": 0, "WARN": 1, "INFO": 2}
@@ -72,6 +82,8 @@ def add(
     location: Optional[str] = None,
     origin: Optional[str] = None,
     line: Optional[str] = None,
+    *,
+    unknown_id: Optional[str] = None,
 ) -> None:
     """Add a diagnostic to the collector, deduplicating identical entries.
 
@@ -82,12 +94,20 @@ def add(
         message: Human-readable diagnostic message
         location: Optional file:line:column location
         origin: Optional origin module identifier
+        line: Optional source line text
+        unknown_id: Id of the unknown construct the message starts with
 
     Returns:
         None
     """
     diagnostic = Diagnostic(
-        severity=severity, code=code, message=message, location=location, origin=origin, line=line
+        severity=severity,
+        code=code,
+        message=message,
+        location=location,
+        origin=origin,
+        line=line,
+        unknown_id=unknown_id,
     )
     if _dedupe_key(diagnostic) in {_dedupe_key(d) for d in collector.diagnostics}:
         return
@@ -105,7 +125,41 @@ def extend(collector: DiagnosticCollector, items: Iterable[Diagnostic]) -> None:
         None
     """
     for item in items:
-        add(collector, item.severity, item.code, item.message, item.location, item.origin)
+        add(
+            collector,
+            item.severity,
+            item.code,
+            item.message,
+            item.location,
+            item.origin,
+            unknown_id=item.unknown_id,
+        )
+
+
+def error_codes(collector: DiagnosticCollector) -> Set[str]:
+    """Return the codes of all ERROR diagnostics in the collector.
+
+    Only diagnostics appended since the previous call are scanned, so the
+    repeated checks between pipeline stages stay cheap as the list grows.
+    If the list was replaced or shrank it is rescanned from the start.
+
+    Args:
+        collector: DiagnosticCollector instance to inspect
+
+    Returns:
+        Set of error codes; treat it as read-only
+    """
+    items = collector.diagnostics
+    if items is not collector._scanned_list or len(items) < collector._scanned:
+        collector._error_codes = set()
+        collector._scanned = 0
+        collector._scanned_list = items
+    if len(items) > collector._scanned:
+        collector._error_codes.update(
+            d.code for d in islice(items, collector._scanned, None) if d.severity == "ERROR"
+        )
+        collector._scanned = len(items)
+    return collector._error_codes
 
 
 def has_errors(collector: DiagnosticCollector) -> bool:
@@ -117,7 +171,7 @@ def has_errors(collector: DiagnosticCollector) -> bool:
     Returns:
         True if any ERROR severity diagnostics exist, False otherwise
     """
-    return any(d.severity == "ERROR" for d in collector.diagnostics)
+    return bool(error_codes(collector))
 
 
 def to_console(collector: DiagnosticCollector, *, stream: TextIO, verbose: bool, unknown_count: int = 0) -> None:
@@ -132,6 +186,8 @@ def to_console(collector: DiagnosticCollector, *, stream: TextIO, verbose: bool,
     Returns:
         None
     """
+    if not collector.diagnostics and not unknown_count:
+        return
     ordered = sorted(
         collector.diagnostics, key=lambda d: (_SEVERITY_ORDER.get(d.severity, 99), d.code, d.message)
     )
@@ -9,6 +9,8 @@ from __future__ import annotations
 from enum import IntEnum
 from typing import TYPE_CHECKING
 
+from gmake2cmake.diagnostics import error_codes as collect_error_codes
+
 if TYPE_CHECKING:
     from gmake2cmake.diagnostics import DiagnosticCollector
 
@@ -87,11 +89,7 @@ def get_exit_code(collector: DiagnosticCollector) -> int:
     Returns:
         ExitCode integer (0-5) indicating the failure category
     """
-    error_codes = {
-        d.code for d in collector.diagnostics
-        if d.severity == "ERROR"
-    }
-
+    error_codes = collect_error_codes(collector)
     if not error_codes:
         return ExitCode.SUCCESS
 
@@ -1,11 +1,27 @@
 from __future__ import annotations
 
+import io
+import os
 import shutil
 import tempfile
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Generator, List, Protocol
+from typing import BinaryIO, Dict, Generator, List, Protocol
+
+__all__ = [
+    "FileSystemAdapter",
+    "LocalFS",
+    "TestFileSystemAdapter",
+    "atomic_write",
+    "open_write",
+    "temporary_directory",
+]
+
+# Raw open flags for whole-file reads; O_CLOEXEC/O_BINARY only exist on
+# some platforms.
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+_READ_CHUNK = 64 * 1024
 
 
 class FileSystemAdapter(Protocol):
@@ -199,6 +215,26 @@ class FileSystemAdapter(Protocol):
         ...
 
 
+def _read_bytes(path: Path) -> bytes:
+    """Read a whole file with raw ``os`` calls, sized from ``fstat``.
+
+    Skips the buffered reader and ``isatty`` probe that ``open()`` sets up.
+    Reading continues to EOF in case the file grew or ``st_size`` is 0 for
+    a special file.
+    """
+    fd = os.open(path, _READ_FLAGS)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size) if size else b""
+        chunk = os.read(fd, _READ_CHUNK)
+        while chunk:
+            data += chunk
+            chunk = os.read(fd, _READ_CHUNK)
+        return data
+    finally:
+        os.close(fd)
+
+
 @dataclass
 class LocalFS:
     """Real filesystem adapter using pathlib for local filesystem operations.
@@ -223,7 +259,7 @@ class LocalFS:
             OSError: For other IO errors with path context
         """
         try:
-            return path.read_text(encoding="utf-8")
+            text = _read_bytes(path).decode("utf-8")
         except FileNotFoundError as e:
             raise FileNotFoundError(f"Cannot read file (not found): {path}") from e
         except PermissionError as e:
@@ -238,6 +274,10 @@ class LocalFS:
             ) from e
         except OSError as e:
             raise OSError(f"Error reading file {path}: {e}") from e
+        # Match text-mode universal newlines without a TextIOWrapper.
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
 
     def write_text(self, path: Path, data: str) -> None:
         """Write text contents to file with UTF-8 encoding.
@@ -249,13 +289,44 @@ class LocalFS:
         Returns:
             None
 
+        Raises:
+            PermissionError: If lacking write permission
+            OSError: For other IO errors with path context
+        """
+        try:
+            try:
+                path.write_text(data, encoding="utf-8")
+            except FileNotFoundError:
+                # Parents are created only when missing, so writes into an
+                # existing directory cost no mkdir/stat syscalls.
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(data, encoding="utf-8")
+        except PermissionError as e:
+            raise PermissionError(f"Cannot write file (permission denied): {path}") from e
+        except OSError as e:
+            raise OSError(f"Error writing file {path}: {e}") from e
+
+    def open_write(self, path: Path) -> BinaryIO:
+        """Open a file for streamed binary writes, replacing any existing content.
+
+        Lets callers such as ``json.dump`` write straight to disk instead of
+        building the whole payload in memory first. Data is streamed into a
+        temporary file beside ``path`` and moved into place on close; leaving a
+        ``with`` block through an exception discards it and keeps the old file.
+
+        Args:
+            path: Path to file to write (parent directories created if needed)
+
+        Returns:
+            Buffered binary writer; the caller must close it
+
         Raises:
             PermissionError: If lacking write permission
             OSError: For other IO errors with path context
         """
         try:
             path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(data, encoding="utf-8")
+            return _ReplacingWrite(path)
         except PermissionError as e:
             raise PermissionError(f"Cannot write file (permission denied): {path}") from e
         except OSError as e:
@@ -533,6 +604,10 @@ class TestFileSystemAdapter:
             self.mtimes[normalized] = self._next_mtime
             self._next_mtime += 1.0
 
+    def open_write(self, path: Path) -> BinaryIO:
+        """Open a virtual file for binary writes; stored when closed."""
+        return _PendingWrite(self, path)
+
     def read_file(self, path: Path) -> bytes:
         """Read file contents as raw bytes."""
         return self.read_text(path).encode("utf-8")
@@ -597,6 +672,106 @@ class TestFileSystemAdapter:
         return self.mtimes[normalized]
 
 
+def open_write(fs: FileSystemAdapter, path: Path) -> BinaryIO:
+    """Open a file for streamed binary writes through an adapter.
+
+    Adapters that provide ``open_write`` (LocalFS, TestFileSystemAdapter)
+    return their own writer; any other adapter gets an in-memory buffer that
+    is passed to ``write_text`` as UTF-8 when closed.
+
+    Args:
+        fs: Filesystem adapter to write through
+        path: Path to file to write
+
+    Returns:
+        Binary writer; the caller must close it
+
+    Raises:
+        OSError: Propagated from the adapter
+    """
+    opener = getattr(fs, "open_write", None)
+    if opener is not None:
+        return opener(path)
+    return _PendingWrite(fs, path)
+
+
+class _PendingWrite(io.BytesIO):
+    """Bytes buffer that hands its UTF-8 contents to ``write_text`` on close.
+
+    Leaving a ``with`` block through an exception drops the buffer without
+    writing, so a failed writer never replaces the target.
+    """
+
+    def __init__(self, fs: FileSystemAdapter, path: Path) -> None:
+        super().__init__()
+        self._fs = fs
+        self._path = path
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            super().close()
+        else:
+            self.close()
+
+    def close(self) -> None:
+        if not self.closed:
+            self._fs.write_text(self._path, self.getvalue().decode("utf-8"))
+        super().close()
+
+
+class _ReplacingWrite(io.BufferedWriter):
+    """Writer that streams into a sibling temp file and replaces the target on close.
+
+    Mirrors :func:`atomic_write`: the temp file lives in the target directory so
+    the final ``os.replace`` is atomic, and it is removed instead when a ``with``
+    block exits through an exception.
+    """
+
+    def __init__(self, path: Path) -> None:
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp_", suffix=path.suffix)
+        try:
+            if hasattr(os, "fchmod"):
+                os.fchmod(fd, 0o644)
+            super().__init__(io.FileIO(fd, "wb"))
+        except BaseException:
+            os.close(fd)
+            os.unlink(temp_path)
+            raise
+        self._temp_path = temp_path
+        self._path = path
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.discard()
+        else:
+            self.close()
+
+    def discard(self) -> None:
+        """Close the writer and delete the temp file, leaving the target untouched."""
+        if self.closed:
+            return
+        try:
+            super().close()
+        finally:
+            try:
+                os.unlink(self._temp_path)
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            super().close()
+            os.replace(self._temp_path, self._path)
+        except BaseException:
+            try:
+                os.unlink(self._temp_path)
+            except OSError:
+                pass
+            raise
+
+
 @contextmanager
 def atomic_write(target_path: Path) -> Generator[Path, None, None]:
     """Context manager for atomic file writes.
@@ -629,7 +804,6 @@ def atomic_write(target_path: Path) -> Generator[Path, None, None]:
 
     try:
         # Close the file descriptor since we'll be using Path for writing
-        import os
         os.close(temp_fd)
         yield temp_path
         # Atomic rename (or copy on Windows)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from typing import Dict, List, Optional, Tuple
 
 from gmake2cmake.config import (
@@ -33,12 +33,17 @@ class SourceFile:
     path: str
     language: str
     flags: List[str]
+    # Parsed once here so the emitter does not rebuild path objects per use.
+    path_obj: PurePosixPath = field(init=False, repr=False, compare=False)
+    parent: PurePosixPath = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if not self.path or not self.path.strip():
             raise ValueError("path cannot be empty")
         if not self.language or not self.language.strip():
             raise ValueError("language cannot be empty")
+        self.path_obj = PurePosixPath(self.path)
+        self.parent = self.path_obj.parent
 
 
 @dataclass
@@ -77,6 +82,11 @@ class ProjectGlobalConfig:
     feature_toggles: Dict[str, str | bool]
     sources: List[str]
 
+    @property
+    def has_interface_requirements(self) -> bool:
+        """Whether includes, defines or flags call for a global INTERFACE target."""
+        return bool(self.includes or self.defines or self.flags)
+
 
 @dataclass
 class Project:
@@ -138,7 +148,7 @@ def build_project_global_config(globals: ProjectGlobals, config: ConfigModel, di
     def apply_flag_mappings_to_lang_flags(flags_by_lang: Dict[str, List[str]]) -> Dict[str, List[str]]:
         result = {}
         all_unmapped = set()
-        for lang, flag_list in flags_by_lang.items():
+        for lang, flag_list in sorted(flags_by_lang.items()):
             mapped, unmapped = apply_flag_mapping(flag_list, config)
             result[lang] = mapped
             all_unmapped.update(unmapped)
@@ -149,12 +159,14 @@ def build_project_global_config(globals: ProjectGlobals, config: ConfigModel, di
 
         return result
 
+    # Mappings are stored in key order and lists sorted, so the emitter's own
+    # sorts of these values are linear passes over already-ordered data.
     return ProjectGlobalConfig(
-        vars=dict(globals.vars),
+        vars=dict(sorted(globals.vars.items())),
         flags=apply_flag_mappings_to_lang_flags(globals.flags),
         defines=sorted(set(normalize_and_filter(globals.defines))),
         includes=sorted(set(normalize_and_filter(globals.includes))),
-        feature_toggles=dict(globals.feature_toggles),
+        feature_toggles=dict(sorted(globals.feature_toggles.items())),
         sources=sorted(set(normalize_and_filter(globals.sources))),
     )
 
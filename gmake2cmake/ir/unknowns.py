@@ -88,6 +88,20 @@ class UnknownConstructFactory:
         self._counter += 1
         return uc
 
+    def reassign_id(self, uc: UnknownConstruct) -> str:
+        """Give an existing construct this factory's next id.
+
+        Used to merge constructs created by another factory (e.g. in a worker
+        process) into this factory's numbering.
+
+        Returns:
+            The construct's previous id
+        """
+        previous = uc.id
+        uc.id = _format_uc_id(self._counter)
+        self._counter += 1
+        return previous
+
 
 def to_dict(uc: UnknownConstruct) -> Dict:
     payload = {
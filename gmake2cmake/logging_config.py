@@ -241,6 +241,16 @@ def log_timed_block(
 ):
     """Context manager that logs start/finish with duration for critical operations."""
     logger = get_logger(logger_name)
+    if verbosity < 1:
+        # Quiet runs only report failures, so skip the timing bookkeeping.
+        try:
+            yield
+        except Exception:
+            logger.error(
+                "operation failed", extra={"event": "error", "operation": name}, exc_info=True
+            )
+            raise
+        return
     status = "ok"
     start = time.perf_counter()
     if verbosity >= 2:
@@ -253,14 +263,13 @@ def log_timed_block(
         raise
     finally:
         duration_ms = (time.perf_counter() - start) * 1000.0
-        if verbosity >= 1:
-            logger.log(
-                level,
-                "complete",
-                extra={
-                    "event": "complete",
-                    "operation": name,
-                    "duration_ms": round(duration_ms, 3),
-                    "status": status,
-                },
-            )
+        logger.log(
+            level,
+            "complete",
+            extra={
+                "event": "complete",
+                "operation": name,
+                "duration_ms": round(duration_ms, 3),
+                "status": status,
+            },
+        )
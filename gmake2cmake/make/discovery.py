@@ -15,6 +15,8 @@ class IncludeGraph:
     edges: Dict[str, Set[str]] = field(default_factory=dict)
     roots: List[str] = field(default_factory=list)
     cycles: List[List[str]] = field(default_factory=list)
+    # Text of each Makefile read during the scan, reused by collect_contents.
+    texts: Dict[str, str] = field(default_factory=dict, repr=False, compare=False)
 
 
 @dataclass
@@ -77,7 +79,10 @@ def scan_includes(entry: Path, fs: FileSystemAdapter, diagnostics: DiagnosticCol
         graph.nodes.add(node)
         lines = []
         try:
-            lines = fs.read_text(path).splitlines()
+            text = graph.texts.get(node)
+            if text is None:
+                text = graph.texts[node] = fs.read_text(path)
+            lines = text.splitlines()
         except (OSError, UnicodeDecodeError) as exc:  # pragma: no cover - IO error
             add(
                 diagnostics,
@@ -211,7 +216,9 @@ def collect_contents(graph: IncludeGraph, fs: FileSystemAdapter, diagnostics: Di
             invalid_nodes.add(node)
             return
         try:
-            text = fs.read_text(Path(node))
+            text = graph.texts.get(node)
+            if text is None:
+                text = fs.read_text(Path(node))
             if len(text.encode("utf-8", errors="ignore")) > MAX_FILE_SIZE_BYTES:
                 if node not in seen_failures:
                     add(
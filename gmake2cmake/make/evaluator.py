@@ -197,11 +197,15 @@ def _consume_variable_ref(
     seen.add(var_name)
     replacement, was_func = _replace_var(var_name, env, auto_vars)
     if was_func:
+        prefix, uc_id = _register_unknown(
+            "make_function", var_name, location, unknown_factory, facts
+        )
         add(
             diagnostics,
             "WARN",
             "UNKNOWN_CONSTRUCT",
-            f"{_register_unknown('make_function', var_name, location, unknown_factory, facts)} Unsupported make function",
+            f"{prefix} Unsupported make function",
+            unknown_id=uc_id,
         )
     return replacement, end + 1
 
@@ -388,11 +392,13 @@ def _evaluate_conditional(
     if test.startswith("ifndef"):
         name = test[len("ifndef") :].strip(" ()")
         return node.false_body if env.get(name) else node.true_body
+    prefix, uc_id = _register_unknown("conditional_logic", test, node.location, factory, facts)
     add(
         diagnostics,
         "WARN",
         "UNKNOWN_CONSTRUCT",
-        f"{_register_unknown('conditional_logic', test, node.location, factory, facts)} Unsupported conditional",
+        f"{prefix} Unsupported conditional",
+        unknown_id=uc_id,
     )
     return node.true_body
 
@@ -475,7 +481,7 @@ def _register_unknown(
     location: parser.SourceLocation,
     factory: Optional[UnknownConstructFactory],
     facts: Optional[BuildFacts],
-) -> str:
+) -> Tuple[str, Optional[str]]:
     """Register an unknown construct and return a location prefix for diagnostic messages.
 
     Args:
@@ -486,14 +492,15 @@ def _register_unknown(
         facts: Optional BuildFacts to accumulate unknowns in
 
     Returns:
-        A location prefix string (e.g., "UNKNOWN_001 at Makefile:42:") for use in messages.
-        If factory or facts is None, returns just the location in format "at Makefile:line:".
+        A location prefix string (e.g., "UC0001 at Makefile:42:") for use in messages, and
+        the construct id it starts with. If factory or facts is None, returns just the
+        location in format "at Makefile:line:" and None.
     """
     loc_str = f"{location.path}:{location.line}"
 
     if factory is None or facts is None:
         # When factory/facts not provided, still include location information
-        return f"at {loc_str}:"
+        return f"at {loc_str}:", None
 
     uc = factory.create(
         category=category,
@@ -507,4 +514,4 @@ def _register_unknown(
         suggested_action="manual_review",
     )
     facts.unknown_constructs.append(uc)
-    return f"{uc.id} at {loc_str}:"
+    return f"{uc.id} at {loc_str}:", uc.id
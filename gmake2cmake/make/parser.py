@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from gmake2cmake.ir.unknowns import UnknownConstruct, UnknownConstructFactory
 from gmake2cmake.types import DiagnosticDict
@@ -209,7 +209,14 @@ def _handle_unknown_construct(stripped: str, context: ParseContext, loc: SourceL
         suggested_action="manual_review",
     )
     context.unknowns.append(uc)
-    add_diagnostic(context.diagnostics, "WARN", "UNKNOWN_CONSTRUCT", f"{uc.id}: Unknown syntax", loc)
+    add_diagnostic(
+        context.diagnostics,
+        "WARN",
+        "UNKNOWN_CONSTRUCT",
+        f"{uc.id}: Unknown syntax",
+        loc,
+        unknown_id=uc.id,
+    )
     return None
 
 
@@ -285,7 +292,15 @@ def _strip_comment(line: str) -> str:
     return result.rstrip()
 
 
-def add_diagnostic(diagnostics: List[DiagnosticDict], severity: str, code: str, message: str, loc: SourceLocation) -> None:
+def add_diagnostic(
+    diagnostics: List[DiagnosticDict],
+    severity: str,
+    code: str,
+    message: str,
+    loc: SourceLocation,
+    *,
+    unknown_id: Optional[str] = None,
+) -> None:
     """Add a diagnostic to the diagnostics list.
 
     Args:
@@ -294,6 +309,7 @@ def add_diagnostic(diagnostics: List[DiagnosticDict], severity: str, code: str,
         code: Diagnostic code identifier
         message: Human-readable diagnostic message
         loc: Source location information
+        unknown_id: Id of the unknown construct the message starts with
 
     Returns:
         None
@@ -305,6 +321,8 @@ def add_diagnostic(diagnostics: List[DiagnosticDict], severity: str, code: str,
         "location": f"{loc.path}:{loc.line}",
         "origin": None,
     }
+    if unknown_id is not None:
+        diag["unknown_id"] = unknown_id
     diagnostics.append(diag)
 
 
@@ -16,6 +16,7 @@ class DiagnosticDict(TypedDict, total=False):
     message: str
     location: Optional[str]
     origin: Optional[str]
+    unknown_id: str
 
 
 __all__ = ["DiagnosticDict"]
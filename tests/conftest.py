@@ -39,6 +39,12 @@ class FakeFS:
         return None
 
 
+@pytest.fixture(autouse=True)
+def _isolated_cache_home(tmp_path_factory, monkeypatch):
+    """Keep the CLI analysis cache out of the real user cache directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache-home")))
+
+
 # ============================================================================
 # Pytest Fixtures for Test Coverage (TASK-0059)
 # ============================================================================
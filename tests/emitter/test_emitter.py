@@ -4,6 +4,7 @@ from pathlib import Path
 
 from gmake2cmake.cmake import emitter
 from gmake2cmake.diagnostics import DiagnosticCollector
+from gmake2cmake.fs import LocalFS, TestFileSystemAdapter
 from gmake2cmake.ir import builder
 
 
@@ -250,6 +251,144 @@ def test_emit_reports_write_failures(tmp_path):
     assert any(d.code == "EMIT_WRITE_FAIL" for d in diagnostics.diagnostics)
 
 
+def test_emit_writes_each_directory_once_and_all_files(tmp_path):
+    targets = [
+        _make_target(
+            artifact=f"lib{name}.a",
+            name=name,
+            target_type="static",
+            sources=[builder.SourceFile(path=f"{name}/{name}.c", language="c", flags=[])],
+        )
+        for name in ("alpha", "beta", "gamma")
+    ]
+    project = builder.Project(
+        name="Demo",
+        version="1.0.0",
+        namespace="Demo",
+        languages=["C"],
+        targets=targets,
+        project_config=_project_config(),
+    )
+
+    class RecordingFS(LocalFS):
+        def __init__(self):
+            self.created = []
+
+        def makedirs(self, path):
+            self.created.append(Path(path))
+            super().makedirs(path)
+
+    fs = RecordingFS()
+    result = emitter.emit(
+        project,
+        tmp_path,
+        options=emitter.EmitOptions(dry_run=False, packaging=True, namespace="Demo"),
+        fs=fs,
+        diagnostics=DiagnosticCollector(),
+    )
+
+    assert len(fs.created) == len(set(fs.created))
+    for generated in result.generated_files:
+        assert Path(generated.path).read_text(encoding="utf-8") == generated.content
+
+
+def test_emit_without_retained_files_writes_same_output(tmp_path, monkeypatch):
+    targets = [
+        _make_target(
+            artifact=f"lib{name}.a",
+            name=name,
+            target_type="static",
+            sources=[builder.SourceFile(path=f"{name}/{name}.c", language="c", flags=[])],
+        )
+        for name in ("alpha", "beta", "gamma")
+    ]
+    project = builder.Project(
+        name="Demo",
+        version="1.0.0",
+        namespace="Demo",
+        languages=["C"],
+        targets=targets,
+        project_config=_project_config(),
+    )
+    planned = emitter.emit(
+        project,
+        tmp_path / "planned",
+        options=emitter.EmitOptions(dry_run=True, packaging=True, namespace="Demo"),
+        fs=LocalFS(),
+        diagnostics=DiagnosticCollector(),
+    )
+    monkeypatch.setattr(emitter, "_WRITE_BATCH", 2)
+
+    result = emitter.emit(
+        project,
+        tmp_path / "planned",
+        options=emitter.EmitOptions(
+            dry_run=False, packaging=True, namespace="Demo", retain_files=False
+        ),
+        fs=LocalFS(),
+        diagnostics=DiagnosticCollector(),
+    )
+
+    assert result.generated_files == []
+    for generated in planned.generated_files:
+        assert Path(generated.path).read_text(encoding="utf-8") == generated.content
+
+
+def test_emit_skips_writing_unchanged_files():
+    target = _make_target(
+        artifact="libcore.a",
+        name="core",
+        target_type="static",
+        sources=[builder.SourceFile(path="src/core.c", language="c", flags=[])],
+    )
+    project = builder.Project(
+        name="Demo",
+        version="1.0.0",
+        namespace="Demo",
+        languages=["C"],
+        targets=[target],
+        project_config=_project_config(),
+    )
+    fs = TestFileSystemAdapter()
+    options = emitter.EmitOptions(dry_run=False, packaging=False, namespace="Demo")
+    emitter.emit(project, Path("/out"), options=options, fs=fs, diagnostics=DiagnosticCollector())
+    fs.files["/out/CMakeLists.txt"] = "stale\n"
+
+    written = []
+    original_write = fs.write_text
+
+    def recording_write(path, data):
+        written.append(path.as_posix())
+        original_write(path, data)
+
+    fs.write_text = recording_write
+    emitter.emit(project, Path("/out"), options=options, fs=fs, diagnostics=DiagnosticCollector())
+
+    assert written == ["/out/CMakeLists.txt"]
+    assert fs.files["/out/CMakeLists.txt"] != "stale\n"
+
+
+def test_write_if_changed_reads_only_same_size_local_files(tmp_path, monkeypatch):
+    reads = []
+    original_read = Path.read_bytes
+    monkeypatch.setattr(
+        Path, "read_bytes", lambda self: reads.append(self.name) or original_read(self)
+    )
+    fs = LocalFS()
+    target = tmp_path / "CMakeLists.txt"
+
+    emitter._write_if_changed(fs, target, "project(demo)\n")
+    emitter._write_if_changed(fs, target, "project(demo2)\n")
+    assert reads == []
+    assert target.read_text() == "project(demo2)\n"
+
+    reads.clear()
+    emitter._write_if_changed(fs, target, "project(demo2)\n")
+    emitter._write_if_changed(fs, target, "project(demo3)\n")
+    assert reads == ["CMakeLists.txt", "CMakeLists.txt"]
+    assert target.read_text() == "project(demo3)\n"
+
+
 def test_render_target_with_explicit_visibility():
     """Test that target's explicit visibility is used instead of type-based defaults."""
     # Target with INTERFACE visibility override
@@ -389,6 +528,29 @@ def test_render_target_with_custom_commands():
     assert "generated.h" in result.rendered
 
 
+def test_render_target_shared_custom_command_blocks():
+    shared = builder.CustomCommand(
+        name="gen",
+        targets=["gen.h"],
+        prerequisites=["gen.in"],
+        commands=["make_gen gen.in"],
+        outputs=["gen.h"],
+        inputs=["gen.in"],
+    )
+    unnamed = builder.CustomCommand(
+        name="stamp", targets=[], prerequisites=[], commands=["touch stamp"]
+    )
+    rendered = []
+    for name in ("first", "second"):
+        target = _make_target(artifact=name, name=name, target_type="executable")
+        target.custom_commands = [shared, unnamed]
+        rendered.append(emitter.render_target(target, Path("."), "Demo").rendered)
+
+    for name, text in zip(("first", "second"), rendered):
+        assert text.count('add_custom_command(OUTPUT "gen.h"\n  DEPENDS "gen.in"\n') == 1
+        assert f"add_custom_command(OUTPUT {name}\n  COMMAND touch stamp)" in text
+
+
 def test_emit_with_custom_commands_dry_run(tmp_path):
     """Test that custom commands are preserved in dry-run mode."""
     cc = builder.CustomCommand(
@@ -432,3 +594,234 @@ def test_emit_with_custom_commands_dry_run(tmp_path):
             break
     assert lib_cmake_content
     assert "add_custom_command" in lib_cmake_content or "# Custom command" in lib_cmake_content
+
+
+def test_emit_directory_file_matches_individual_renders(tmp_path):
+    targets = [
+        _make_target(
+            artifact=f"lib{name}.a",
+            name=name,
+            target_type=target_type,
+            sources=[builder.SourceFile(path=f"lib/{name}.c", language="c", flags=[])],
+            include_dirs=["lib/include"],
+        )
+        for name, target_type in (("one", "static"), ("two", "mystery"))
+    ]
+    project = builder.Project(
+        name="Demo",
+        version="1.0.0",
+        namespace="Demo",
+        languages=["C"],
+        targets=targets,
+        project_config=_project_config(),
+    )
+    result = emitter.emit(
+        project,
+        tmp_path,
+        options=emitter.EmitOptions(dry_run=True, packaging=False, namespace="Demo"),
+        fs=_noop_fs(),
+        diagnostics=DiagnosticCollector(),
+    )
+
+    lib_dir = tmp_path / "lib"
+    contents = {g.path: g.content for g in result.generated_files}
+    expected = "\n".join(emitter.render_target(t, lib_dir, "Demo").rendered for t in targets)
+    assert contents[(lib_dir / "CMakeLists.txt").as_posix()] == expected
+    assert len(result.unknown_constructs) == 1
+
+
+def test_plan_file_layout_normalizes_without_resolving(tmp_path, monkeypatch):
+    def _no_resolve(self, strict=False):  # pragma: no cover - failure path
+        raise AssertionError("plan_file_layout should not resolve paths")
+
+    monkeypatch.setattr(Path, "resolve", _no_resolve)
+    targets = [
+        _make_target(
+            artifact=f"lib{name}.a",
+            name=name,
+            target_type="static",
+            sources=[builder.SourceFile(path=path, language="c", flags=[])],
+        )
+        for name, path in (
+            ("b", "src/b.c"),
+            ("a", "src/a.c"),
+            ("up", "src/../common/up.c"),
+            ("top", "top.c"),
+        )
+    ]
+    project = builder.Project(
+        name="Demo",
+        version="1.0.0",
+        namespace="Demo",
+        languages=["C"],
+        targets=targets,
+        project_config=_project_config(),
+    )
+
+    layout = emitter.plan_file_layout(project, tmp_path)
+
+    assert {path: [t.name for t in group] for path, group in layout.items()} == {
+        tmp_path.as_posix(): ["top"],
+        (tmp_path / "common").as_posix(): ["up"],
+        (tmp_path / "src").as_posix(): ["a", "b"],
+    }
+
+
+def test_relativize_matches_relative_to():
+    def _reference(path, base):
+        try:
+            return Path(path).relative_to(base).as_posix()
+        except ValueError:
+            return Path(path).as_posix()
+
+    bases = [Path("."), Path("/"), Path("/out"), Path("/out/src"), Path("src")]
+    paths = [
+        "main.c", "src/a.c", "src", "/out/src/a.c", "/out/srcx/a.c",
+        "/out/src", "/out", "/", ".", "srcx/b.c",
+    ]
+    for base in bases:
+        for path in paths:
+            assert emitter._relativize(path, base) == _reference(path, base), (path, base)
+            relativized = emitter._relativize_path(Path(path), base)
+            assert relativized == _reference(path, base), (path, base)
+
+
+def test_render_target_sourceless_library_becomes_interface():
+    target = _make_target(
+        artifact="libheaders.a",
+        name="headers",
+        alias="Demo::headers",
+        target_type="static",
+        include_dirs=["include"],
+    )
+
+    rendered = emitter.render_target(target, Path("."), "Demo").rendered
+
+    assert rendered.splitlines() == [
+        "add_library(headers INTERFACE)",
+        'target_include_directories(headers INTERFACE "include")',
+        "add_library(Demo::headers ALIAS headers)",
+    ]
+
+
+def test_emit_renders_sourceless_library_in_root(tmp_path):
+    headers = _make_target(
+        artifact="libheaders.a",
+        name="headers",
+        alias="Demo::headers",
+        target_type="static",
+        include_dirs=["include"],
+    )
+    project = builder.Project(
+        name="Demo",
+        version="1.0.0",
+        namespace="Demo",
+        languages=["C"],
+        targets=[headers],
+        project_config=_project_config(),
+    )
+
+    result = emitter.emit(
+        project,
+        tmp_path,
+        options=emitter.EmitOptions(dry_run=True, packaging=False, namespace="Demo"),
+        fs=_noop_fs(),
+        diagnostics=DiagnosticCollector(),
+    )
+
+    contents = {g.path: g.content for g in result.generated_files}
+    root = contents[(tmp_path / "CMakeLists.txt").as_posix()]
+    assert "add_library(headers INTERFACE)\n" in root
+    assert 'target_include_directories(headers INTERFACE "include")\n' in root
+    assert "add_library(Demo::headers ALIAS headers)\n" in root
+    assert "add_subdirectory" not in root
+
+
+def test_emit_renders_sourceless_interface_and_imported_in_root(tmp_path):
+    iface = _make_target(
+        artifact="iface", name="iface", alias="Demo::iface", target_type="interface"
+    )
+    imported = _make_target(artifact="prebuilt", name="prebuilt", target_type="imported")
+    headers = _make_target(artifact="libhdr.a", name="hdr", alias="Demo::hdr", target_type="static")
+    project = builder.Project(
+        name="Demo",
+        version="1.0.0",
+        namespace="Demo",
+        languages=["C"],
+        targets=[headers, iface, imported],
+        project_config=_project_config(),
+    )
+
+    result = emitter.emit(
+        project,
+        tmp_path,
+        options=emitter.EmitOptions(dry_run=True, packaging=False, namespace="Demo"),
+        fs=_noop_fs(),
+        diagnostics=DiagnosticCollector(),
+    )
+
+    contents = {g.path: g.content for g in result.generated_files}
+    root = contents[(tmp_path / "CMakeLists.txt").as_posix()]
+    assert "add_library(hdr INTERFACE)\n" in root
+    assert "add_library(iface INTERFACE)\n" in root
+    assert "add_library(Demo::iface ALIAS iface)\n" in root
+    assert "add_library(prebuilt UNKNOWN IMPORTED)\n" in root
+
+
+def test_render_target_without_requirements_is_bare():
+    iface = _make_target(artifact="iface", name="thin", alias="Demo::thin", target_type="interface")
+    imported = _make_target(artifact="prebuilt", name="prebuilt", target_type="imported")
+
+    iface_rendered = emitter.render_target(iface, Path("."), "Demo").rendered
+    imported_rendered = emitter.render_target(
+        imported, Path("."), "Demo", global_link="Demo::global_options"
+    ).rendered
+
+    assert iface_rendered.splitlines() == [
+        "add_library(thin INTERFACE)",
+        "add_library(Demo::thin ALIAS thin)",
+    ]
+    assert imported_rendered.splitlines() == ["add_library(prebuilt UNKNOWN IMPORTED)"]
+
+
+def test_join_posix_matches_path_join():
+    for base in (".", "/", "/out", "out/sub", "/out/sub"):
+        expected = (Path(base) / "CMakeLists.txt").as_posix()
+        assert emitter._join_posix(base, "CMakeLists.txt") == expected
+
+
+def test_sorted_unique_reuses_sorted_input():
+    already = ["a", "b", "c"]
+    assert emitter._sorted_unique(already) is already
+    assert emitter._sorted_unique(["b", "a", "b"]) == ["a", "b"]
+    assert emitter._sorted_unique(["a", "a"]) == ["a"]
+    assert emitter._sorted_unique([]) == []
+
+
+def test_dedupe_keeps_first_occurrence_and_drops_empty():
+    assert emitter._dedupe(["b", "", "a", "b", "c", "a", ""]) == ["b", "a", "c"]
+
+
+def test_alias_lookup_matches_artifact_name_and_stem():
+    target = _make_target(
+        artifact="out/lib/libcore.so.1", name="core", alias="Demo::core", target_type="shared"
+    )
+
+    lookup = emitter._build_alias_lookup([target])
+
+    keys = ("Demo::core", "core", "libcore.so", "libcore.so.1")
+    assert lookup == {key: "Demo::core" for key in keys}
+
+
+def test_render_global_module_feature_toggles_in_name_order():
+    config = _project_config(feature_toggles={"WITH_Z": False, "MODE": "fast", "WITH_A": True})
+
+    rendered = emitter.render_global_module(
+        config, "Demo", interface_name="demo_global_options", alias="Demo::G"
+    )
+
+    assert rendered.splitlines()[1:] == [
+        'set(MODE "fast" CACHE STRING "Feature toggle from Make")',
+        'option(WITH_A "Feature toggle from Make" ON)',
+        'option(WITH_Z "Feature toggle from Make" OFF)',
+    ]
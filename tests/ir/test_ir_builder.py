@@ -452,6 +452,22 @@ def test_global_config_flag_mapping():
     assert project.project_config.flags["cpp"] == ["-O3"]
 
 
+
+def test_global_config_mappings_in_key_order():
+    """Global vars, flags and toggles are stored sorted by key."""
+    facts = evaluator.BuildFacts()
+    facts.project_globals.vars.update({"ZED": "1", "ALPHA": "2"})
+    facts.project_globals.flags.update({"cpp": ["-O2"], "c": ["-O2"]})
+    facts.project_globals.feature_toggles.update({"WITH_Z": True, "WITH_A": False})
+
+    model = ConfigModel(project_name="Demo")
+    project = builder.build_project(facts, model, DiagnosticCollector()).project
+    assert project is not None
+    config = project.project_config
+    assert list(config.vars) == ["ALPHA", "ZED"]
+    assert list(config.flags) == ["c", "cpp"]
+    assert list(config.feature_toggles) == ["WITH_A", "WITH_Z"]
+
 def test_global_config_ignore_paths():
     """Test that ignored paths are removed from global config."""
     facts = evaluator.BuildFacts()
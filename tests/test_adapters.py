@@ -0,0 +1,54 @@
+"""Tests for lazy adapter re-exports."""
+
+from __future__ import annotations
+
+import importlib
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    ("adapter", "source", "names"),
+    [
+        (
+            "gmake2cmake.adapters.filesystem",
+            "gmake2cmake.fs",
+            [
+                "FileSystemAdapter",
+                "LocalFS",
+                "TestFileSystemAdapter",
+                "atomic_write",
+                "open_write",
+                "temporary_directory",
+            ],
+        ),
+        ("gmake2cmake.adapters.cmake", "gmake2cmake.cmake.emitter", ["EmitOptions", "emit"]),
+    ],
+)
+def test_adapter_exports_resolve_to_source(adapter, source, names):
+    module = importlib.import_module(adapter)
+    origin = importlib.import_module(source)
+    for name in names:
+        assert getattr(module, name) is getattr(origin, name)
+    assert sorted(names) == dir(module)
+
+
+def test_adapter_unknown_attribute_raises():
+    module = importlib.import_module("gmake2cmake.adapters.cmake")
+    with pytest.raises(AttributeError):
+        module.render_target  # noqa: B018
+
+
+def test_filesystem_adapter_mirrors_fs_exports():
+    from gmake2cmake import fs
+    from gmake2cmake.adapters import filesystem
+
+    assert filesystem.__all__ == fs.__all__
+
+
+def test_filesystem_adapter_survives_reload():
+    from gmake2cmake import fs
+    from gmake2cmake.adapters import filesystem
+
+    reloaded = importlib.reload(filesystem)
+    assert reloaded.LocalFS is fs.LocalFS
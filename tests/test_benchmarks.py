@@ -6,12 +6,15 @@ Run with: pytest tests/test_benchmarks.py -v --tb=short
 
 from __future__ import annotations
 
+import pytest
+
 from gmake2cmake.benchmarks import (
     PERFORMANCE_TARGETS,
     Benchmark,
     BenchmarkResult,
     BenchmarkSuite,
     benchmark_function,
+    profile_function,
 )
 
 
@@ -38,6 +41,17 @@ class TestBenchmarkResult:
 
         assert result.avg_time_ms == 0.0
 
+    def test_ops_per_sec_derived(self):
+        """Ops per second should be filled in from iterations and time."""
+        result = BenchmarkResult(name="test", elapsed_seconds=2.0, iterations=10)
+
+        assert result.ops_per_sec == 5.0
+
+    def test_ops_per_sec_explicit_and_zero_time(self):
+        """Explicit rates are kept and zero elapsed time yields no rate."""
+        assert BenchmarkResult(name="a", elapsed_seconds=1.0, ops_per_sec=7.0).ops_per_sec == 7.0
+        assert BenchmarkResult(name="b", elapsed_seconds=0.0).ops_per_sec == 0.0
+
 
 class TestBenchmarkSuite:
     """Tests for BenchmarkSuite class."""
@@ -93,6 +107,26 @@ class TestBenchmarkSuite:
         assert comparison["time_ratio"] == 2.0
         assert comparison["time_improvement_percent"] == -100.0
 
+    def test_get_result_returns_first_match(self):
+        """Lookup by name should return the first result with that name."""
+        suite = BenchmarkSuite(name="test")
+        first = BenchmarkResult(name="op", elapsed_seconds=1.0)
+        suite.add_result(first)
+        suite.add_result(BenchmarkResult(name="op", elapsed_seconds=2.0))
+
+        assert suite.get_result("op") is first
+        assert suite.get_result("missing") is None
+
+    def test_get_result_sees_directly_appended_results(self):
+        """Results appended to the list after a lookup should still be found."""
+        suite = BenchmarkSuite(name="test")
+        assert suite.get_result("late") is None
+
+        late = BenchmarkResult(name="late", elapsed_seconds=1.0)
+        suite.results.append(late)
+
+        assert suite.get_result("late") is late
+
     def test_print_summary(self):
         """Summary should be formatted correctly."""
         suite = BenchmarkSuite(name="test")
@@ -104,6 +138,20 @@ class TestBenchmarkSuite:
         assert "op" in summary
         assert "1.000s" in summary
 
+    def test_write_summary_streams_same_text(self):
+        """Streaming the summary should match the joined string."""
+        import io
+
+        baseline = BenchmarkSuite(name="base")
+        baseline.add_result(BenchmarkResult(name="op", elapsed_seconds=2.0))
+        suite = BenchmarkSuite(name="test", baseline=baseline)
+        suite.add_result(BenchmarkResult(name="op", elapsed_seconds=1.0))
+
+        buffer = io.StringIO()
+        suite.write_summary(buffer)
+
+        assert buffer.getvalue() == suite.print_summary() + "\n"
+
 
 class TestBenchmarkContextManager:
     """Tests for Benchmark context manager."""
@@ -118,6 +166,15 @@ class TestBenchmarkContextManager:
         assert bench.result is not None
         assert bench.result.elapsed_seconds >= 0.01
 
+    def test_benchmark_records_integer_nanoseconds(self):
+        """Elapsed time should be kept in integer nanoseconds."""
+        with Benchmark("test") as bench:
+            pass
+
+        assert isinstance(bench.elapsed_ns, int)
+        assert bench.result is not None
+        assert bench.result.elapsed_seconds == bench.elapsed_ns / 1e9
+
     def test_benchmark_result_creation(self):
         """Benchmark should create result on exit."""
         with Benchmark("test_op", iterations=5) as bench:
@@ -145,6 +202,29 @@ class TestBenchmarkContextManager:
         # Memory tracking should work (exact amount depends on Python internals)
         assert bench.result.memory_peak_mb >= 0.0
 
+    def test_benchmark_precise_memory_uses_tracemalloc(self):
+        """Precise memory mode should trace allocations and stop afterwards."""
+        import tracemalloc
+
+        with Benchmark("test", precise_memory=True) as bench:
+            assert tracemalloc.is_tracing()
+            _ = [str(i) for i in range(100000)]
+
+        assert not tracemalloc.is_tracing()
+        assert bench.track_memory is True
+        assert bench.result is not None
+        assert bench.result.memory_peak_mb > 0.0
+
+    def test_benchmark_rss_tracking_does_not_trace(self):
+        """Default memory tracking should not enable tracemalloc."""
+        import tracemalloc
+
+        with Benchmark("test", track_memory=True) as bench:
+            assert not tracemalloc.is_tracing()
+
+        assert bench.result is not None
+        assert bench.result.memory_peak_mb >= 0.0
+
     def test_benchmark_exception_handling(self):
         """Benchmark should record result even if exception occurs."""
         try:
@@ -193,6 +273,52 @@ class TestBenchmarkFunction:
 
         assert call_count[0] == 5
 
+    def test_benchmark_autorange(self):
+        """Auto mode should pick the iteration count and keep the result."""
+        call_count = [0]
+
+        def tiny_op(n: int) -> int:
+            call_count[0] += 1
+            return n + 1
+
+        result, bench = benchmark_function(tiny_op, 1, auto=True, iterations=3)
+
+        assert result == 2
+        assert bench.iterations >= 1
+        assert call_count[0] >= bench.iterations
+        assert bench.elapsed_seconds >= 0.2
+
+
+class TestProfileFunction:
+    """Tests for profile_function modes."""
+
+    def test_cprofile_mode_returns_result(self):
+        """Deterministic profiling should pass through the function result."""
+        assert profile_function(lambda n: n + 1, 1, mode="cprofile") == 2
+
+    def test_report_goes_to_file_only(self, capsys):
+        """Reports should be written to the given stream, never to stdout."""
+        import io
+
+        report = io.StringIO()
+        assert profile_function(lambda n: n * 2, 4, file=report) == 8
+        assert "function calls" in report.getvalue()
+        assert profile_function(lambda: None) is None
+        assert capsys.readouterr().out == ""
+
+    def test_unknown_mode_rejected(self):
+        """Unknown profiler modes should raise ValueError."""
+        with pytest.raises(ValueError):
+            profile_function(lambda: None, mode="bogus")
+
+    def test_sampling_mode_requires_pyinstrument(self, monkeypatch):
+        """Sampling mode should surface a missing optional dependency."""
+        import sys
+
+        monkeypatch.setitem(sys.modules, "pyinstrument", None)
+        with pytest.raises(ImportError):
+            profile_function(lambda: None, mode="sampling")
+
 
 class TestPerformanceTargets:
     """Tests for performance targets validation."""
@@ -204,9 +330,13 @@ class TestPerformanceTargets:
     def test_target_structure(self):
         """Each target should have required fields."""
         for name, target in PERFORMANCE_TARGETS.items():
-            assert "time_ms" in target
-            assert "description" in target
-            assert target["time_ms"] > 0
+            assert target.description
+            assert target.time_ms > 0
+
+    def test_targets_read_only(self):
+        """Performance targets should not be mutable at runtime."""
+        with pytest.raises(TypeError):
+            PERFORMANCE_TARGETS["parse_makefile"] = None  # type: ignore[index]
 
 
 class TestPerformanceBenchmarking:
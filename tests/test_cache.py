@@ -6,6 +6,8 @@ from gmake2cmake.cache import (
     CacheConfig,
     CacheStats,
     EvaluationCache,
+    PickleDirectoryCache,
+    compute_content_key,
     make_cache_default,
     make_cache_disabled,
 )
@@ -177,6 +179,32 @@ class TestEvaluationCache:
         cache.get_variable_expansion("VAR1", "h", callback)
         assert cache.stats.hits == 1
 
+    def test_eviction_spans_variable_and_compile_entries(self):
+        """Test LRU order is shared between variable and compile entries."""
+        from gmake2cmake.make.evaluator import InferredCompile
+        from gmake2cmake.make.parser import SourceLocation
+
+        config = CacheConfig(enabled=True, max_size=2)
+        cache = EvaluationCache(config)
+        compiled = InferredCompile(
+            source="a.c",
+            output="a.o",
+            language="c",
+            flags=[],
+            includes=[],
+            defines=[],
+            location=SourceLocation(path="Makefile", line=1, column=1),
+        )
+
+        cache.get_compile_inference("cmd", lambda _h: compiled)
+        cache.get_variable_expansion("VAR1", "h", lambda v, _e: v)
+        # Touch the compile entry so VAR1 becomes least recently used
+        cache.get_compile_inference("cmd", lambda _h: None)
+        cache.get_variable_expansion("VAR2", "h", lambda v, _e: v)
+
+        assert cache.stats.evictions == 1
+        assert cache.get_compile_inference("cmd", lambda _h: None) is compiled
+
     def test_clear_cache(self):
         """Test clearing cache."""
         config = CacheConfig(enabled=True, max_size=100)
@@ -189,9 +217,7 @@ class TestEvaluationCache:
         assert cache.stats.hits + cache.stats.misses > 0
 
         cache.clear()
-        assert len(cache._variable_cache) == 0
-        assert len(cache._compile_cache) == 0
-        assert len(cache._access_order) == 0
+        assert len(cache._entries) == 0
 
     def test_get_stats(self):
         """Test getting cache statistics."""
@@ -279,3 +305,37 @@ class TestCacheFactories:
         assert cache.config.enabled is True
         assert cache.config.max_size == 1024
         assert cache.config.ttl_seconds is None
+
+
+class TestPickleDirectoryCache:
+    """Tests for the per-key pickle cache."""
+
+    def test_round_trip_and_stats(self, tmp_path):
+        """Stored values should be readable by a fresh instance."""
+        cache = PickleDirectoryCache(tmp_path / "store")
+        key = compute_content_key("Makefile", "all: app")
+
+        assert cache.get(key) is None
+        cache.put(key, {"targets": ["app"]})
+
+        assert PickleDirectoryCache(tmp_path / "store").get(key) == {"targets": ["app"]}
+        assert (cache.stats.hits, cache.stats.misses) == (0, 1)
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        """Unreadable entries should be treated as misses."""
+        cache = PickleDirectoryCache(tmp_path)
+        (tmp_path / "bad.pkl").write_bytes(b"not a pickle")
+
+        assert cache.get("bad") is None
+
+    def test_unpicklable_value_is_skipped(self, tmp_path):
+        """Values that cannot be pickled should not be stored."""
+        cache = PickleDirectoryCache(tmp_path)
+        cache.put("key", lambda: None)
+
+        assert cache.get("key") is None
+
+    def test_content_key_separates_parts(self):
+        """Part boundaries should affect the key."""
+        assert compute_content_key("ab", "c") != compute_content_key("a", "bc")
+        assert len(compute_content_key("x")) == 32
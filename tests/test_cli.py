@@ -3,6 +3,7 @@ from __future__ import annotations
 import io
 import json
 import sys
+from pathlib import Path
 
 import pytest
 
@@ -23,6 +24,17 @@ def test_parse_args_defaults_and_packaging():
     assert args.entry_makefile == "Makefile"
 
 
+def test_parse_args_normalizes_paths_without_resolving(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    args = cli.parse_args(
+        ["--source-dir", "src/../proj", "--output-dir", "~/out", "--config", "./cfg.yaml"]
+    )
+    assert args.source_dir == tmp_path / "proj"
+    assert args.output_dir == tmp_path / "home" / "out"
+    assert args.config_path == tmp_path / "cfg.yaml"
+
+
 def test_run_propagates_errors_and_report(tmp_path, monkeypatch):
     fs = FakeFS()
 
@@ -229,3 +241,247 @@ def test_parse_args_validate_config():
 
     args = cli.parse_args([])
     assert args.validate_config is False
+
+
+def test_parallel_pipeline_matches_serial(tmp_path):
+    source = tmp_path / "src"
+    source.mkdir()
+    (source / "Makefile").write_text(
+        "include sub.mk\nLIST := $(call RULE,x)\nthis is not make\n"
+        "app: main.o\n\t$(CC) -o app main.o\n"
+    )
+    (source / "sub.mk").write_text(
+        "OTHER := $(call RULE,y)\nstill not make\nlib.o: lib.c\n\t$(CC) -c lib.c -o lib.o\n"
+    )
+
+    def run_with(processes: str) -> tuple[dict, dict]:
+        output = tmp_path / f"out-{processes}"
+        argv = [
+            "--source-dir", str(source), "--output-dir", str(output),
+            "--report", "--processes", processes,
+        ]
+        assert cli.run(argv) == 0
+        report = json.loads((output / "report.json").read_text())
+        generated = {
+            path.relative_to(output).as_posix(): path.read_text()
+            for path in sorted(output.rglob("*.cmake")) + sorted(output.rglob("CMakeLists.txt"))
+        }
+        return report, generated
+
+    serial_report, serial_files = run_with("1")
+    parallel_report, parallel_files = run_with("2")
+
+    serial_ids = [uc["id"] for uc in serial_report["unknown_constructs"]]
+    assert serial_ids == ["UC0001", "UC0002", "UC0003", "UC0004"]
+    assert parallel_report == serial_report
+    assert parallel_files == serial_files
+
+
+def test_renumber_message_replaces_only_declared_id():
+    renamed = {"UC0001": "UC0007"}
+
+    assert cli._renumber_message("UC0001: Unknown syntax near UC0001X", "UC0001", renamed) == (
+        "UC0007: Unknown syntax near UC0001X",
+        "UC0007",
+    )
+    passing = cli._renumber_message("mentions UC0001 in passing", None, renamed)
+    assert passing == ("mentions UC0001 in passing", None)
+    assert cli._renumber_message("see UC0001", "UC0001", renamed) == ("see UC0001", "UC0007")
+    orphan = cli._renumber_message("UC0002: orphan", "UC0002", renamed)
+    assert orphan == ("UC0002: orphan", "UC0002")
+
+
+def test_pool_falls_back_only_on_pool_failures(monkeypatch):
+    import concurrent.futures
+    from concurrent.futures.process import BrokenProcessPool
+    from types import SimpleNamespace
+
+    class FailingPool:
+        error: Exception
+
+        def __init__(self, max_workers):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def map(self, *args):
+            raise self.error
+
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", FailingPool)
+    ctx = SimpleNamespace(config=None, args=SimpleNamespace(verbose=0))
+    contents = [SimpleNamespace(path="Makefile", content="")]
+
+    FailingPool.error = BrokenProcessPool("worker died")
+    assert cli._analyze_in_pool(contents, ctx, 2) is None
+
+    FailingPool.error = TypeError("bug in a stage")
+    with pytest.raises(TypeError):
+        cli._analyze_in_pool(contents, ctx, 2)
+
+
+def test_make_in_path_looks_up_once(monkeypatch):
+    calls = []
+    monkeypatch.setattr(cli, "which", lambda name: calls.append(name) or "/usr/bin/make")
+    cli._make_in_path.cache_clear()
+    try:
+        assert cli._make_in_path() is True
+        assert cli._make_in_path() is True
+    finally:
+        cli._make_in_path.cache_clear()
+    assert calls == ["make"]
+
+
+def test_serialize_diagnostics_normalizes_missing_fields():
+    collector = cli.DiagnosticCollector()
+    add(collector, "WARN", "TEST", "first", location="Makefile:3", origin="parser", line="x := y")
+    add(collector, "ERROR", "TEST", "second")
+
+    assert cli._serialize_diagnostics(collector) == [
+        {
+            "severity": "WARN",
+            "code": "TEST",
+            "message": "first",
+            "location": "Makefile:3",
+            "origin": "parser",
+            "line": "x := y",
+        },
+        {
+            "severity": "ERROR",
+            "code": "TEST",
+            "message": "second",
+            "location": "",
+            "origin": "",
+            "line": "",
+        },
+    ]
+
+
+def test_analysis_cache_reused_across_runs(tmp_path, monkeypatch):
+    source = tmp_path / "src"
+    source.mkdir()
+    (source / "Makefile").write_text("LIST := $(call RULE,x)\napp: main.o\n\t$(CC) -o app main.o\n")
+    calls = []
+    analyze = cli._analyze_file
+    monkeypatch.setattr(cli, "_analyze_file", lambda *args: calls.append(args[0]) or analyze(*args))
+
+    def run_once(*extra: str) -> dict:
+        output = tmp_path / "out"
+        argv = [
+            "--source-dir", str(source), "--output-dir", str(output),
+            "--report", "--processes", "1", *extra,
+        ]
+        assert cli.run(argv) == 0
+        return json.loads((output / "report.json").read_text())
+
+    first = run_once("--cache")
+    second = run_once("--cache")
+    assert len(calls) == 1
+    assert second == first
+    assert [uc["id"] for uc in second["unknown_constructs"]] == ["UC0001"]
+
+    # Without --cache a single worker runs the stages in-process.
+    assert run_once() == first
+    assert len(calls) == 1
+
+    (source / "Makefile").write_text("app: main.o\n\t$(CC) -o app main.o\n")
+    assert run_once("--cache", "--dry-run")["unknown_constructs"] == []
+    assert run_once("--cache")["unknown_constructs"] == []
+    assert len(calls) == 3
+
+
+def test_profile_summary_emitted_once(tmp_path, monkeypatch):
+    from gmake2cmake import profiling
+
+    stream = io.StringIO()
+    monkeypatch.setattr(cli, "_stdout", lambda: stream)
+    monkeypatch.setattr(profiling, "_metrics", profiling.ProfilingMetrics())
+    summaries = []
+    monkeypatch.setattr(
+        profiling.ProfilingMetrics, "get_summary", lambda self: summaries.append(1) or ""
+    )
+
+    def pipeline(ctx: cli.RunContext) -> None:
+        profiling.get_metrics().add_timing("parse", 0.5)
+
+    argv = ["--source-dir", str(tmp_path), "--profile"]
+    assert cli.run(argv, fs=FakeFS(), pipeline_fn=pipeline) == 0
+    cli._emit_profile_summary()
+
+    assert len(summaries) == 1
+    assert not profiling.is_profiling_enabled()
+    assert stream.getvalue() == "\n"
+
+
+def test_parser_built_once_and_reused():
+    assert cli._build_parser() is cli._build_parser()
+    first = cli.parse_args(["--dry-run", "--processes", "3"])
+    second = cli.parse_args([])
+    assert first.dry_run and first.processes == 3
+    assert not second.dry_run and second.processes is None
+
+
+def test_report_json_stream_matches_json_dumps(monkeypatch):
+    from gmake2cmake.ir.unknowns import UnknownConstructFactory
+
+    collector = cli.DiagnosticCollector()
+    add(collector, "WARN", "TEST", "first é", location="Makefile:3")
+    add(collector, "ERROR", "TEST", "second")
+    factory = UnknownConstructFactory()
+    unknowns = [
+        factory.create(category="make_syntax", file="Makefile", raw_snippet=s) for s in ("a", "b")
+    ]
+    introspection = cli.IntrospectionSummary(enabled=False).to_dict()
+    report = {
+        "diagnostics": cli._serialize_diagnostics(collector),
+        "unknown_constructs": [cli.unknown_to_dict(u) for u in unknowns],
+        "introspection": introspection,
+    }
+
+    streamed = b"".join(cli._iter_report_json(collector, unknowns, introspection))
+    assert json.loads(streamed) == report
+
+    monkeypatch.setattr(cli, "ORJSON_AVAILABLE", False)
+    expected = json.dumps(report, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    assert b"".join(cli._iter_report_json(collector, unknowns, introspection)).decode() == expected
+    empty = b"".join(cli._iter_report_json(cli.DiagnosticCollector(), [], introspection))
+    assert json.loads(empty) == {
+        "diagnostics": [],
+        "unknown_constructs": [],
+        "introspection": introspection,
+    }
+
+
+def test_report_serialize_failure_leaves_no_partial_file(monkeypatch, tmp_path):
+    from gmake2cmake.fs import LocalFS
+
+    def broken_stream(diagnostics, unknowns, introspection):
+        yield b'{"diagnostics":['
+        raise TypeError("not serializable")
+
+    monkeypatch.setattr(cli, "_iter_report_json", broken_stream)
+    collector = cli.DiagnosticCollector()
+    cli._write_report(tmp_path, collector, LocalFS(), [], project_name="demo")
+
+    assert [d.code for d in collector.diagnostics] == ["REPORT_SERIALIZE_FAIL"]
+    assert not (tmp_path / cli.REPORT_JSON_FILENAME).exists()
+    assert not list(tmp_path.glob(".tmp_*"))
+
+
+def test_cli_import_defers_config_and_serializers():
+    import subprocess
+
+    probe = (
+        "import sys, gmake2cmake.cli; "
+        "print(sorted(m for m in "
+        "('gmake2cmake.config', 'gmake2cmake.validation', 'yaml', 'orjson') "
+        "if m in sys.modules))"
+    )
+    repo_root = Path(__file__).resolve().parents[1]
+    result = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True, cwd=repo_root
+    )
+    assert result.stdout.strip() == "[]"
@@ -8,6 +8,7 @@ from gmake2cmake.diagnostics import (
     Diagnostic,
     DiagnosticCollector,
     add,
+    error_codes,
     exit_code,
     extend,
     has_errors,
@@ -85,3 +86,26 @@ def test_diagnostic_validation():
     )
     assert d.location == "file.mk:10"
     assert d.origin == "parser"
+
+
+def test_error_codes_tracks_appends_and_replacement():
+    collector = DiagnosticCollector()
+    add(collector, "WARN", "UNKNOWN_CONSTRUCT", "warn only")
+    assert error_codes(collector) == set()
+    assert exit_code(collector) == 0
+
+    add(collector, "ERROR", "DISCOVERY_ENTRY_MISSING", "missing")
+    assert error_codes(collector) == {"DISCOVERY_ENTRY_MISSING"}
+    assert exit_code(collector) != 0
+
+    collector.diagnostics = [d for d in collector.diagnostics if d.severity != "ERROR"]
+    assert exit_code(collector) == 0
+    assert not has_errors(collector)
+
+
+def test_to_console_empty_does_not_touch_stream():
+    class NoWrite(io.StringIO):
+        def write(self, text):  # pragma: no cover - failure path
+            raise AssertionError("unexpected write")
+
+    to_console(DiagnosticCollector(), stream=NoWrite(), verbose=True)
@@ -40,6 +40,24 @@ def test_collect_contents_ordering(tmp_path):
     assert contents[1].path == inc.as_posix()
 
 
+def test_discover_reads_each_makefile_once(tmp_path):
+    reads = []
+
+    class CountingFS(FakeFS):
+        def read_text(self, path):
+            reads.append(path)
+            return super().read_text(path)
+
+    fs = CountingFS()
+    root = (tmp_path / "Makefile").resolve()
+    inc = (tmp_path / "inc.mk").resolve()
+    fs.store[root] = "include inc.mk\nall:\n\techo hi"
+    fs.store[inc] = "VAR=1"
+    graph, contents = discovery.discover(tmp_path, "Makefile", fs, DiagnosticCollector())
+    assert [c.content for c in contents] == ["include inc.mk\nall:\n\techo hi", "VAR=1"]
+    assert sorted(reads) == sorted([root, inc])
+
+
 def test_scan_includes_optional_include_missing_warns_only(tmp_path):
     """Optional includes missing should only warn, not error."""
     fs = FakeFS()
@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 
-from gmake2cmake.fs import LocalFS, TestFileSystemAdapter
+from gmake2cmake.fs import LocalFS, TestFileSystemAdapter, open_write
 
 
 class TestLocalFS:
@@ -34,6 +34,54 @@ class TestLocalFS:
             assert path.exists()
             assert path.read_text() == "test content"
 
+    def test_write_text_existing_dir_skips_mkdir(self, tmp_path, monkeypatch):
+        """Test writes into an existing directory do not create parents."""
+        def _fail_mkdir(self, *args, **kwargs):
+            raise AssertionError("mkdir should not be called")
+
+        monkeypatch.setattr(Path, "mkdir", _fail_mkdir)
+        LocalFS().write_text(tmp_path / "out.txt", "content")
+
+        assert (tmp_path / "out.txt").read_text() == "content"
+
+    def test_read_text_translates_newlines(self, tmp_path):
+        """Test raw reads match text-mode universal newline handling."""
+        path = tmp_path / "Makefile"
+        path.write_bytes(b"a := 1\r\nb := caf\xc3\xa9\rc := 3\n")
+
+        assert LocalFS().read_text(path) == path.read_text(encoding="utf-8")
+
+    def test_read_text_empty_file(self, tmp_path):
+        """Test reading an empty file returns an empty string."""
+        path = tmp_path / "empty.mk"
+        path.touch()
+
+        assert LocalFS().read_text(path) == ""
+
+    def test_open_write_streams_and_truncates(self, tmp_path):
+        """Test streamed writes create parents and replace existing content."""
+        target = tmp_path / "sub" / "out.json"
+        target.parent.mkdir()
+        target.write_text("old content that is longer")
+
+        with LocalFS().open_write(target) as handle:
+            handle.write(b"{}")
+
+        assert target.read_bytes() == b"{}"
+
+    def test_open_write_failure_keeps_previous_file(self, tmp_path):
+        """Test a writer left through an exception discards its partial output."""
+        target = tmp_path / "out.json"
+        target.write_text("previous")
+
+        with pytest.raises(ValueError):
+            with LocalFS().open_write(target) as handle:
+                handle.write(b"{\"partial\":")
+                raise ValueError("boom")
+
+        assert target.read_text() == "previous"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["out.json"]
+
     def test_read_file_bytes(self):
         """Test reading file as bytes."""
         with tempfile.NamedTemporaryFile(mode='wb', delete=False) as f:
@@ -505,3 +553,41 @@ class TestLocalFSErrorHandling:
             # Check that __cause__ is set (error chaining with 'from')
             assert e.__cause__ is not None
             assert isinstance(e.__cause__, FileNotFoundError)
+
+
+class TestOpenWriteHelper:
+    """Tests for the adapter-agnostic open_write helper."""
+
+    def test_virtual_adapter_stores_on_close(self):
+        """Virtual files should appear once the writer is closed."""
+        fs = TestFileSystemAdapter()
+        with open_write(fs, Path("/out.json")) as handle:
+            handle.write("caf\u00e9".encode("utf-8"))
+        assert fs.files == {"/out.json": "caf\u00e9"}
+
+    def test_virtual_adapter_drops_failed_writer(self):
+        """A writer left through an exception should not store anything."""
+        fs = TestFileSystemAdapter()
+        with pytest.raises(ValueError):
+            with open_write(fs, Path("/out.json")) as handle:
+                handle.write(b"{")
+                raise ValueError("boom")
+        assert fs.files == {}
+
+    def test_falls_back_to_write_text(self):
+        """Adapters without open_write should receive one write_text call."""
+
+        class MinimalFS:
+            def __init__(self):
+                self.writes = []
+
+            def write_text(self, path, data):
+                self.writes.append((path, data))
+
+        fs = MinimalFS()
+        handle = open_write(fs, Path("/a"))
+        handle.write(b"1")
+        handle.write(b"2")
+        handle.close()
+        handle.close()
+        assert fs.writes == [(Path("/a"), "12")]
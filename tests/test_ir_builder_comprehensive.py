@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from pathlib import PurePosixPath
+
 import pytest
 
 from gmake2cmake.config import ConfigModel
@@ -77,6 +79,14 @@ class TestSourceFile:
         with pytest.raises(ValueError, match="language cannot be empty"):
             SourceFile(path="main.c", language="", flags=[])
 
+    def test_source_file_precomputes_paths(self):
+        """Parsed path and parent are cached and ignored by equality."""
+        src = SourceFile(path="src/core/main.c", language="C", flags=[])
+
+        assert src.path_obj == PurePosixPath("src/core/main.c")
+        assert src.parent == PurePosixPath("src/core")
+        assert src == SourceFile(path="src/core/main.c", language="C", flags=[])
+
 
 class TestTarget:
     """Tests for Target class."""
@@ -165,6 +175,15 @@ class TestProjectGlobalConfig:
         assert config.flags["CFLAGS"] == ["-Wall"]
         assert "DEBUG" in config.defines
 
+    def test_has_interface_requirements(self):
+        """Includes, defines or flags each call for a global interface."""
+        empty = dict(
+            vars={"CC": "gcc"}, flags={}, defines=[], includes=[], feature_toggles={}, sources=[]
+        )
+        assert not ProjectGlobalConfig(**empty).has_interface_requirements
+        for key, value in (("flags", {"c": ["-O2"]}), ("defines", ["D"]), ("includes", ["inc"])):
+            assert ProjectGlobalConfig(**{**empty, key: value}).has_interface_requirements
+
 
 class TestProject:
     """Tests for Project class."""
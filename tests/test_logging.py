@@ -7,6 +7,8 @@ import json
 import logging
 import time
 
+import pytest
+
 from gmake2cmake.logging_config import (
     get_correlation_id,
     get_logger,
@@ -105,6 +107,22 @@ def test_log_timed_block_emits_duration():
     assert complete_entry["duration_ms"] > 0
 
 
+def test_log_timed_block_quiet_only_reports_failures():
+    """At verbosity 0 only failed operations should be logged."""
+    stream = io.StringIO()
+    reset_correlation_id()
+    setup_logging(verbosity=2, stream=stream)
+
+    with log_timed_block("quiet", verbosity=0, logger_name="test.timer"):
+        pass
+    with pytest.raises(RuntimeError):
+        with log_timed_block("failing", verbosity=0, logger_name="test.timer"):
+            raise RuntimeError("boom")
+
+    entries = _parse_stream(stream)
+    assert [(entry["event"], entry["operation"]) for entry in entries] == [("error", "failing")]
+
+
 def test_syslog_handler_attached(monkeypatch):
     """Syslog handler can be configured without raising."""
     attached = {}